@@ -12,23 +12,85 @@ Features:
 - Serialization/deserialization of complex objects
 """
 
+import asyncio
 import os
+import socket
 import time
 import json
 import pickle
 import hashlib
 import logging
 import functools
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Set
 from datetime import datetime, timedelta
 from functools import lru_cache
 from threading import RLock
 import redis
 
+# msgpack is optional: binary, smaller on the wire, and faster to encode than
+# JSON. The serializer falls back to the stdlib formats when it is missing.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson is likewise optional: a native JSON codec that emits bytes directly,
+# several times faster than the stdlib on the per-round-trip hot path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bind the codec callables once at import so the serializer hot path pays no
+# per-call module attribute lookups; stdlib json.loads accepts bytes directly
+if orjson is not None:
+    _json_dumps_bytes = orjson.dumps
+    _json_loads_bytes = orjson.loads
+else:
+    def _json_dumps_bytes(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+    _json_loads_bytes = json.loads
+_pickle_dumps = pickle.dumps
+_pickle_loads = pickle.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("caching")
 
+# Upper bound on commands buffered per Redis pipeline; bulk operations are
+# chunked so arbitrarily large mappings cannot balloon client-side memory
+PIPELINE_BATCH_SIZE = 1000
+
+# Writes above this size would head-of-line block the shared Redis socket
+MAX_CACHE_BYTES = 256 * 1024
+
+# How many recent writes each Redis backend remembers for write elision
+RECENT_WRITE_TRACKING = 1024
+
+# Longest a non-expiring write may be elided before being re-sent anyway
+RECENT_WRITE_MAX_AGE = 300
+
+# Detect dead peers on long-lived pooled connections; the TCP_KEEP* options
+# are Linux-only, so fall back to the bare SO_KEEPALIVE flag elsewhere
+if hasattr(socket, "TCP_KEEPIDLE"):
+    SOCKET_KEEPALIVE_OPTIONS = {
+        socket.TCP_KEEPIDLE: 30,
+        socket.TCP_KEEPINTVL: 10,
+        socket.TCP_KEEPCNT: 3,
+    }
+else:
+    SOCKET_KEEPALIVE_OPTIONS = {}
+
+# Server-side bulk SET with one shared expiry: the script runs in a single
+# round-trip and Redis parses the EX argument once instead of once per key
+_SETEX_MANY_LUA = """
+for i = 1, #KEYS do
+  redis.call('SET', KEYS[i], ARGV[i + 1], 'EX', ARGV[1])
+end
+return #KEYS
+"""
+
 # Import settings after logger configuration to avoid circular imports
 from config import settings
 
@@ -166,7 +228,7 @@ class MemoryCache(CacheBackend):
         self._hits = 0
         self._misses = 0
         self._evictions = 0
-        logger.info(f"Memory cache initialized with max size: {max_size}")
+        logger.info("Memory cache initialized with max size: %s", max_size)
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -290,7 +352,7 @@ class RedisCache(CacheBackend):
         self, 
         namespace: str = "default", 
         redis_url: Optional[str] = None,
-        serializer: str = "pickle"
+        serializer: Optional[str] = None
     ):
         """
         Initialize the Redis cache.
@@ -298,41 +360,121 @@ class RedisCache(CacheBackend):
         Args:
             namespace: Namespace for cache keys
             redis_url: Redis connection URL
-            serializer: Serializer to use ('json' or 'pickle')
+            serializer: Serializer to use ('json', 'pickle' or 'msgpack');
+                defaults to the CACHE_SERIALIZER setting
         """
         super().__init__(namespace)
         
-        # Use provided URL or get from settings
-        self._redis_url = redis_url or settings.REDIS_URL
+        # Use provided URL or get from settings. When Redis is colocated,
+        # REDIS_UNIX_SOCKET points at its socket file and skips the TCP
+        # stack entirely — redis-py builds a unix-domain pool from the URL
+        unix_socket = os.environ.get("REDIS_UNIX_SOCKET")
+        if redis_url:
+            self._redis_url = redis_url
+        elif unix_socket:
+            self._redis_url = f"unix://{unix_socket}"
+        else:
+            self._redis_url = settings.REDIS_URL
+        
+        # Clustered Redis (REDIS_CLUSTER=1) hashes keys to slots; wrapping
+        # the namespace in a {hash tag} keeps a namespace on one slot so
+        # multi-key commands (MGET, pipelines) stay CROSSSLOT-free
+        self._cluster_mode = os.environ.get("REDIS_CLUSTER") == "1"
+        if self._cluster_mode:
+            self.namespace = "{%s}" % namespace
         
         # Set up serializer
+        serializer = serializer or settings.CACHE_SERIALIZER
         if serializer == "json":
             self._serialize = self._serialize_json
             self._deserialize = self._deserialize_json
         elif serializer == "pickle":
             self._serialize = self._serialize_pickle
             self._deserialize = self._deserialize_pickle
+        elif serializer == "msgpack":
+            if msgpack is None:
+                raise ValueError("msgpack serializer requested but msgpack is not installed")
+            self._serialize = self._serialize_msgpack
+            self._deserialize = self._deserialize_msgpack
         else:
             raise ValueError(f"Unknown serializer: {serializer}")
         
         self._serializer = serializer
+        # Connection is deferred to first use (see the client property), so
+        # constructing the backend costs no network round-trip
         self._client = None
-        self._connect()
-        logger.info(f"Redis cache initialized with {serializer} serializer")
+        self._setex_many = None
+        # key -> (payload digest, monotonic write time, ttl) of recent SETs,
+        # used to elide re-writes of identical values
+        self._recent_writes: "OrderedDict[str, Tuple[bytes, float, Optional[int]]]" = OrderedDict()
+        # (operation, exception type) pairs already logged with a traceback;
+        # bounds traceback formatting while Redis is down
+        self._error_seen: Set[Tuple[str, str]] = set()
+        logger.info("Redis cache initialized with %s serializer", serializer)
+    
+    @property
+    def client(self) -> "redis.Redis":
+        """Lazily-connected Redis client."""
+        if self._client is None:
+            self._connect()
+        return self._client
+    
+    def _log_redis_error(self, operation: str, error: Exception) -> None:
+        """
+        Log a Redis error without re-formatting tracebacks at request rate.
+        
+        The first occurrence per (operation, exception type) carries the
+        full traceback; repeats while the failure persists log one line.
+        The seen-set resets on the next successful operation.
+        
+        Args:
+            operation: Name of the failing cache operation
+            error: The caught exception
+        """
+        marker = (operation, type(error).__name__)
+        if marker not in self._error_seen:
+            self._error_seen.add(marker)
+            logger.error("Redis error in %s(): %s", operation, error, exc_info=True)
+        else:
+            logger.warning("Redis error in %s(): %s", operation, error)
     
     def _connect(self) -> None:
         """Connect to Redis."""
         try:
-            self._client = redis.from_url(
+            if self._cluster_mode:
+                # RedisCluster manages one pool per node internally
+                self._client = redis.cluster.RedisCluster.from_url(
+                    self._redis_url,
+                    socket_timeout=settings.get_redis_connection_args()["socket_timeout"],
+                    decode_responses=False,
+                )
+                return
+            # A bounded blocking pool caps the sockets this process can open
+            # against Redis and makes callers wait briefly under contention
+            # instead of exhausting the server's maxclients
+            # Socket timeouts come from the shared resolver in config so
+            # this backend and any other Redis consumer cannot drift apart
+            conn_args = settings.get_redis_connection_args()
+            pool = redis.BlockingConnectionPool.from_url(
                 self._redis_url,
-                socket_timeout=5,
-                socket_connect_timeout=5,
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=conn_args["socket_timeout"],
+                socket_connect_timeout=conn_args["socket_connect_timeout"],
+                socket_keepalive=True,
+                socket_keepalive_options=SOCKET_KEEPALIVE_OPTIONS,
+                health_check_interval=30,
                 decode_responses=False,  # We handle decoding ourselves
             )
-            # Test connection
-            self._client.ping()
+            self._client = redis.Redis(connection_pool=pool)
+            # No eager ping: the first real command surfaces connection
+            # problems, and the pool health-checks idle connections, so a
+            # healthy startup saves a round-trip. Set REDIS_EAGER_PING=1 to
+            # restore the probe when debugging connectivity.
+            if os.environ.get("REDIS_EAGER_PING") == "1":
+                self._client.ping()
         except redis.RedisError as e:
-            logger.error(f"Redis connection error: {e}")
+            logger.error("Redis connection error: %s", e)
             raise CacheBackendError(f"Could not connect to Redis: {e}") from e
     
     def _serialize_json(self, value: Any) -> bytes:
@@ -346,7 +488,7 @@ class RedisCache(CacheBackend):
             bytes: Serialized value
         """
         try:
-            return json.dumps(value).encode("utf-8")
+            return _json_dumps_bytes(value)
         except (TypeError, ValueError) as e:
             raise SerializationError(f"JSON serialization error: {e}") from e
     
@@ -361,7 +503,7 @@ class RedisCache(CacheBackend):
             Any: Deserialized value
         """
         try:
-            return json.loads(value.decode("utf-8"))
+            return _json_loads_bytes(value)
         except (TypeError, ValueError, UnicodeDecodeError) as e:
             raise SerializationError(f"JSON deserialization error: {e}") from e
     
@@ -376,7 +518,7 @@ class RedisCache(CacheBackend):
             bytes: Serialized value
         """
         try:
-            return pickle.dumps(value)
+            return _pickle_dumps(value)
         except pickle.PickleError as e:
             raise SerializationError(f"Pickle serialization error: {e}") from e
     
@@ -391,10 +533,40 @@ class RedisCache(CacheBackend):
             Any: Deserialized value
         """
         try:
-            return pickle.loads(value)
+            return _pickle_loads(value)
         except pickle.PickleError as e:
             raise SerializationError(f"Pickle deserialization error: {e}") from e
     
+    def _serialize_msgpack(self, value: Any) -> bytes:
+        """
+        Serialize a value using msgpack.
+        
+        Args:
+            value: Value to serialize
+            
+        Returns:
+            bytes: Serialized value
+        """
+        try:
+            return msgpack.packb(value, use_bin_type=True)
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"msgpack serialization error: {e}") from e
+    
+    def _deserialize_msgpack(self, value: bytes) -> Any:
+        """
+        Deserialize a value from msgpack.
+        
+        Args:
+            value: Serialized value
+            
+        Returns:
+            Any: Deserialized value
+        """
+        try:
+            return msgpack.unpackb(value, raw=False)
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"msgpack deserialization error: {e}") from e
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Get a value from the cache.
@@ -407,16 +579,18 @@ class RedisCache(CacheBackend):
         """
         namespaced_key = self._make_key(key)
         try:
-            value = self._client.get(namespaced_key)
+            value = self.client.get(namespaced_key)
+            if self._error_seen:
+                self._error_seen.clear()
             if value is None:
                 return None
             
             return self._deserialize(value)
-        except redis.RedisError as e:
-            logger.error(f"Redis error in get(): {e}")
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("get", e)
             return None
         except SerializationError as e:
-            logger.error(f"Deserialization error in get(): {e}")
+            logger.error("Deserialization error in get(): %s", e)
             return None
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -434,15 +608,45 @@ class RedisCache(CacheBackend):
         namespaced_key = self._make_key(key)
         try:
             serialized = self._serialize(value)
+            
+            # Oversized payloads would monopolize the shared socket
+            if len(serialized) > MAX_CACHE_BYTES:
+                logger.warning(
+                    "Refusing to cache %s: %s bytes exceeds MAX_CACHE_BYTES",
+                    namespaced_key, len(serialized)
+                )
+                return False
+            
+            # Elide the round-trip when the exact payload was written
+            # recently enough that the entry cannot be near expiry
+            digest = hashlib.md5(serialized).digest()
+            now = time.monotonic()
+            recent = self._recent_writes.get(namespaced_key)
+            if recent is not None:
+                last_digest, written_at, last_ttl = recent
+                max_age = ttl / 2 if ttl is not None else RECENT_WRITE_MAX_AGE
+                if (last_digest == digest and last_ttl == ttl
+                        and now - written_at < max_age):
+                    return True
+            
             if ttl is not None:
-                return bool(self._client.setex(namespaced_key, ttl, serialized))
+                result = bool(self.client.setex(namespaced_key, ttl, serialized))
             else:
-                return bool(self._client.set(namespaced_key, serialized))
-        except redis.RedisError as e:
-            logger.error(f"Redis error in set(): {e}")
+                result = bool(self.client.set(namespaced_key, serialized))
+            
+            if self._error_seen:
+                self._error_seen.clear()
+            if result:
+                self._recent_writes[namespaced_key] = (digest, now, ttl)
+                self._recent_writes.move_to_end(namespaced_key)
+                if len(self._recent_writes) > RECENT_WRITE_TRACKING:
+                    self._recent_writes.popitem(last=False)
+            return result
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("set", e)
             return False
         except SerializationError as e:
-            logger.error(f"Serialization error in set(): {e}")
+            logger.error("Serialization error in set(): %s", e)
             return False
     
     def delete(self, key: str) -> bool:
@@ -456,10 +660,13 @@ class RedisCache(CacheBackend):
             bool: True if successful, False otherwise
         """
         namespaced_key = self._make_key(key)
+        # Forget the write record so a later set() of the same payload
+        # is not elided against the now-deleted entry
+        self._recent_writes.pop(namespaced_key, None)
         try:
-            return bool(self._client.delete(namespaced_key))
-        except redis.RedisError as e:
-            logger.error(f"Redis error in delete(): {e}")
+            return bool(self.client.delete(namespaced_key))
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("delete", e)
             return False
     
     def clear(self) -> bool:
@@ -469,16 +676,17 @@ class RedisCache(CacheBackend):
         Returns:
             bool: True if successful, False otherwise
         """
+        self._recent_writes.clear()
         try:
             # Get all keys in the namespace
             pattern = f"{self.namespace}:*"
-            keys = self._client.keys(pattern)
+            keys = self.client.keys(pattern)
             
             if keys:
-                return bool(self._client.delete(*keys))
+                return bool(self.client.delete(*keys))
             return True
-        except redis.RedisError as e:
-            logger.error(f"Redis error in clear(): {e}")
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("clear", e)
             return False
     
     def get_many(self, keys: List[str]) -> Dict[str, Any]:
@@ -493,7 +701,7 @@ class RedisCache(CacheBackend):
         """
         namespaced_keys = [self._make_key(key) for key in keys]
         try:
-            values = self._client.mget(namespaced_keys)
+            values = self.client.mget(namespaced_keys)
             result = {}
             
             for i, value in enumerate(values):
@@ -501,11 +709,11 @@ class RedisCache(CacheBackend):
                     try:
                         result[keys[i]] = self._deserialize(value)
                     except SerializationError as e:
-                        logger.error(f"Deserialization error in get_many(): {e}")
+                        logger.error("Deserialization error in get_many(): %s", e)
             
             return result
-        except redis.RedisError as e:
-            logger.error(f"Redis error in get_many(): {e}")
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("get_many", e)
             return {}
     
     def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
@@ -520,24 +728,39 @@ class RedisCache(CacheBackend):
             bool: True if all operations were successful, False otherwise
         """
         try:
-            pipeline = self._client.pipeline()
-            
+            items = []
             for key, value in mapping.items():
-                namespaced_key = self._make_key(key)
                 try:
-                    serialized = self._serialize(value)
-                    if ttl is not None:
-                        pipeline.setex(namespaced_key, ttl, serialized)
-                    else:
-                        pipeline.set(namespaced_key, serialized)
+                    items.append((self._make_key(key), self._serialize(value)))
                 except SerializationError as e:
-                    logger.error(f"Serialization error in set_many(): {e}")
+                    logger.error("Serialization error in set_many(): %s", e)
                     return False
             
-            pipeline.execute()
+            for start in range(0, len(items), PIPELINE_BATCH_SIZE):
+                batch = items[start:start + PIPELINE_BATCH_SIZE]
+                if ttl is not None:
+                    # One round-trip per batch: the Lua script applies the
+                    # shared expiry server-side instead of N SETEX commands
+                    if self._setex_many is None:
+                        self._setex_many = self.client.register_script(_SETEX_MANY_LUA)
+                    self._setex_many(
+                        keys=[key for key, _ in batch],
+                        args=[ttl, *(value for _, value in batch)],
+                    )
+                else:
+                    # transaction=False: plain pipelining is enough here and
+                    # skips the MULTI/EXEC bookkeeping
+                    pipeline = self.client.pipeline(transaction=False)
+                    for namespaced_key, serialized in batch:
+                        pipeline.set(namespaced_key, serialized)
+                    pipeline.execute()
+                # Forget write records for these keys so a later set() is
+                # not elided against a value this bulk write replaced
+                for namespaced_key, _ in batch:
+                    self._recent_writes.pop(namespaced_key, None)
             return True
-        except redis.RedisError as e:
-            logger.error(f"Redis error in set_many(): {e}")
+        except (redis.RedisError, CacheBackendError) as e:
+            self._log_redis_error("set_many", e)
             return False
 class FileCache(CacheBackend):
     """File-based cache backend."""
@@ -576,7 +799,7 @@ class FileCache(CacheBackend):
         
         self._serializer = serializer
         self._ensure_directory()
-        logger.info(f"File cache initialized in {self._namespace_dir}")
+        logger.info("File cache initialized in %s", self._namespace_dir)
     
     def _ensure_directory(self) -> None:
         """Ensure the cache directory exists."""
@@ -704,7 +927,7 @@ class FileCache(CacheBackend):
                 data = f.read()
                 return self._deserialize(data)
         except (OSError, SerializationError) as e:
-            logger.error(f"Error reading cache file: {e}")
+            logger.error("Error reading cache file: %s", e)
             return None
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -742,7 +965,7 @@ class FileCache(CacheBackend):
             
             return True
         except (OSError, SerializationError) as e:
-            logger.error(f"Error writing cache file: {e}")
+            logger.error("Error writing cache file: %s", e)
             return False
     
     def delete(self, key: str) -> bool:
@@ -767,7 +990,7 @@ class FileCache(CacheBackend):
             
             return True
         except OSError as e:
-            logger.error(f"Error deleting cache file: {e}")
+            logger.error("Error deleting cache file: %s", e)
             return False
     
     def clear(self) -> bool:
@@ -784,7 +1007,7 @@ class FileCache(CacheBackend):
                     os.unlink(file_path)
             return True
         except OSError as e:
-            logger.error(f"Error clearing cache directory: {e}")
+            logger.error("Error clearing cache directory: %s", e)
             return False
 
 
@@ -832,7 +1055,7 @@ class MultiLevelCache:
                 ]
         
         self.backends = backends
-        logger.info(f"Multi-level cache initialized with {len(backends)} backends")
+        logger.info("Multi-level cache initialized with %s backends", len(backends))
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -977,6 +1200,48 @@ class MultiLevelCache:
                 success = True
         
         return success
+    
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache without blocking the event loop.
+        
+        The synchronous backends (Redis sockets, file reads) run in a
+        worker thread, so async callers can overlap many lookups with
+        asyncio.gather instead of serializing on one blocking socket.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[Any]: Cached value or None if not found
+        """
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Set a value in all cache backends without blocking the event loop.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: True if set in at least one backend, False otherwise
+        """
+        return await asyncio.to_thread(self.set, key, value, ttl)
+    
+    async def aget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values from the cache without blocking the event loop.
+        
+        Args:
+            keys: List of cache keys
+            
+        Returns:
+            Dict[str, Any]: Dictionary of key-value pairs for found keys
+        """
+        return await asyncio.to_thread(self.get_many, keys)
 
 
 def cache_key(*args, **kwargs) -> str:
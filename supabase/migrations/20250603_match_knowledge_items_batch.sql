@@ -0,0 +1,37 @@
+-- Batched variant of match_knowledge_items: similarity search for N query
+-- embeddings in one round-trip instead of one RPC call per query. Rows carry
+-- the 1-based ordinal of the query they answer so clients can group results.
+CREATE OR REPLACE FUNCTION match_knowledge_items_batch(
+  query_embeddings vector(1536)[],
+  match_threshold FLOAT,
+  match_count INT
+)
+RETURNS TABLE (
+  query_idx BIGINT,
+  id UUID,
+  content TEXT,
+  meta_data JSONB,
+  domain TEXT,
+  similarity FLOAT
+) LANGUAGE sql STABLE AS $$
+  SELECT
+    q.idx AS query_idx,
+    t.id,
+    t.content,
+    t.meta_data,
+    t.domain,
+    t.similarity
+  FROM unnest(query_embeddings) WITH ORDINALITY AS q(qe, idx)
+  CROSS JOIN LATERAL (
+    SELECT
+      ki.id,
+      ki.content,
+      ki.meta_data,
+      ki.domain,
+      1 - (ki.embedding <=> q.qe) AS similarity
+    FROM knowledge_items ki
+    WHERE 1 - (ki.embedding <=> q.qe) > match_threshold
+    ORDER BY ki.embedding <=> q.qe
+    LIMIT match_count
+  ) t;
+$$;
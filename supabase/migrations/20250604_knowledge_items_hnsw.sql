@@ -0,0 +1,33 @@
+-- ANN index for knowledge_items similarity search. Without it every match
+-- call sequential-scans the table, which is linear in rows; HNSW makes the
+-- probe sub-linear. Requires pgvector >= 0.5.
+CREATE INDEX IF NOT EXISTS idx_knowledge_items_embedding_hnsw
+ON knowledge_items USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- Re-point match_knowledge_items at the index: ordering by the raw distance
+-- operator (instead of the computed similarity alias) is what lets the
+-- planner walk the HNSW index, and ef_search scales with the requested k.
+CREATE OR REPLACE FUNCTION match_knowledge_items(query_embedding vector(1536), match_threshold FLOAT, match_count INT)
+RETURNS TABLE (
+  id UUID,
+  content TEXT,
+  meta_data JSONB,
+  domain TEXT,
+  similarity FLOAT
+) LANGUAGE plpgsql AS $$
+BEGIN
+  EXECUTE format('SET LOCAL hnsw.ef_search = %s', GREATEST(match_count * 4, 40));
+  RETURN QUERY
+  SELECT
+    ki.id,
+    ki.content,
+    ki.meta_data,
+    ki.domain,
+    1 - (ki.embedding <=> query_embedding) AS similarity
+  FROM knowledge_items ki
+  WHERE 1 - (ki.embedding <=> query_embedding) > match_threshold
+  ORDER BY ki.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
@@ -0,0 +1,40 @@
+-- Two-stage similarity search: candidates come from an FP16 (halfvec) HNSW
+-- expression index — half the index size and memory bandwidth of FP32 — and
+-- the top candidates are rescored at full precision. Requires pgvector >= 0.7.
+CREATE INDEX IF NOT EXISTS idx_knowledge_items_embedding_halfvec_hnsw
+ON knowledge_items USING hnsw ((embedding::halfvec(1536)) halfvec_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- The FP32 index is superseded for candidate generation; dropping it halves
+-- index maintenance on writes.
+DROP INDEX IF EXISTS idx_knowledge_items_embedding_hnsw;
+
+CREATE OR REPLACE FUNCTION match_knowledge_items(query_embedding vector(1536), match_threshold FLOAT, match_count INT)
+RETURNS TABLE (
+  id UUID,
+  content TEXT,
+  meta_data JSONB,
+  domain TEXT,
+  similarity FLOAT
+) LANGUAGE plpgsql AS $$
+BEGIN
+  EXECUTE format('SET LOCAL hnsw.ef_search = %s', GREATEST(match_count * 4, 40));
+  RETURN QUERY
+  WITH candidates AS (
+    SELECT ki.id, ki.content, ki.meta_data, ki.domain, ki.embedding
+    FROM knowledge_items ki
+    ORDER BY ki.embedding::halfvec(1536) <=> query_embedding::halfvec(1536)
+    LIMIT match_count * 10
+  )
+  SELECT
+    c.id,
+    c.content,
+    c.meta_data,
+    c.domain,
+    1 - (c.embedding <=> query_embedding) AS similarity
+  FROM candidates c
+  WHERE 1 - (c.embedding <=> query_embedding) > match_threshold
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
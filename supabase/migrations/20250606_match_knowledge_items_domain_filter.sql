@@ -0,0 +1,41 @@
+-- Optional domain pre-filter for similarity search. Scoped queries
+-- ("knowledge about X in domain Y") now restrict the candidate pool before
+-- ranking instead of searching the whole table and discarding client-side.
+-- Adding a defaulted parameter changes the signature, so drop the old one.
+DROP FUNCTION IF EXISTS match_knowledge_items(vector, FLOAT, INT);
+
+CREATE OR REPLACE FUNCTION match_knowledge_items(
+  query_embedding vector(1536),
+  match_threshold FLOAT,
+  match_count INT,
+  filter_domain TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+  id UUID,
+  content TEXT,
+  meta_data JSONB,
+  domain TEXT,
+  similarity FLOAT
+) LANGUAGE plpgsql AS $$
+BEGIN
+  EXECUTE format('SET LOCAL hnsw.ef_search = %s', GREATEST(match_count * 4, 40));
+  RETURN QUERY
+  WITH candidates AS (
+    SELECT ki.id, ki.content, ki.meta_data, ki.domain, ki.embedding
+    FROM knowledge_items ki
+    WHERE filter_domain IS NULL OR ki.domain = filter_domain
+    ORDER BY ki.embedding::halfvec(1536) <=> query_embedding::halfvec(1536)
+    LIMIT match_count * 10
+  )
+  SELECT
+    c.id,
+    c.content,
+    c.meta_data,
+    c.domain,
+    1 - (c.embedding <=> query_embedding) AS similarity
+  FROM candidates c
+  WHERE 1 - (c.embedding <=> query_embedding) > match_threshold
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
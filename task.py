@@ -11,6 +11,7 @@ class Task(Base):
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     completed = Column(Boolean, default=False, nullable=False)
-    order_position = Column(Integer, nullable=False)
+    # Indexed: task listing and reordering both sort on this column
+    order_position = Column(Integer, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,15 +1,29 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy import case, func, select, update
 
 from app.models.task import Task
-from app.models.schemas import TaskCreate, TaskUpdate
+from app.models.schemas import TaskCreate, TaskListItem, TaskUpdate
 
 class TaskService:
     @staticmethod
-    def get_tasks(db: Session, skip: int = 0, limit: int = 100) -> List[Task]:
-        """Get all tasks ordered by order_position"""
-        return db.query(Task).order_by(Task.order_position).offset(skip).limit(limit).all()
+    def get_tasks(db: Session, after: Optional[int] = None, limit: int = 100) -> List[TaskListItem]:
+        """Get tasks ordered by order_position, starting after the given cursor
+
+        Keyset pagination: pass the last seen order_position as `after` to get
+        the next page. Cost stays O(limit) at any page depth, unlike OFFSET
+        which scans and discards all skipped rows.
+
+        Selects only the list columns (no description or timestamps) so the
+        DB skips the Text payload and no ORM instances are hydrated.
+        """
+        query = select(
+            Task.id, Task.title, Task.completed, Task.order_position
+        ).order_by(Task.order_position)
+        if after is not None:
+            query = query.where(Task.order_position > after)
+        rows = db.execute(query.limit(limit)).all()
+        return [TaskListItem.model_construct(**row._mapping) for row in rows]
     
     @staticmethod
     def get_task(db: Session, task_id: int) -> Optional[Task]:
@@ -19,9 +33,10 @@ class TaskService:
     @staticmethod
     def create_task(db: Session, task_create: TaskCreate) -> Task:
         """Create a new task"""
-        # Get the highest order_position and add 1
-        highest_position = db.query(Task).order_by(desc(Task.order_position)).first()
-        new_position = 1 if not highest_position else highest_position.order_position + 1
+        # Get the highest order_position and add 1. SELECT MAX returns a bare
+        # integer instead of hydrating a full ORM row just to read one column
+        max_position = db.query(func.max(Task.order_position)).scalar()
+        new_position = (max_position or 0) + 1
         
         # Create new task
         db_task = Task(
@@ -72,15 +87,17 @@ class TaskService:
     @staticmethod
     def reorder_tasks(db: Session, task_ids: List[int]) -> List[Task]:
         """Reorder tasks based on the provided list of task IDs"""
-        # Get all tasks
-        tasks = db.query(Task).all()
-        task_dict = {task.id: task for task in tasks}
-        
-        # Update order_position for each task
-        for index, task_id in enumerate(task_ids, start=1):
-            if task_id in task_dict:
-                task_dict[task_id].order_position = index
-        
+        if task_ids:
+            # One bulk UPDATE with a CASE over the new positions, instead of
+            # loading every task and dirtying ORM instances one by one
+            positions = {task_id: index for index, task_id in enumerate(task_ids, start=1)}
+            db.execute(
+                update(Task)
+                .where(Task.id.in_(task_ids))
+                .values(order_position=case(positions, value=Task.id))
+                .execution_options(synchronize_session=False)
+            )
+
         db.commit()
         
         # Return tasks in new order
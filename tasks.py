@@ -1,18 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
-from app.models.schemas import TaskCreate, TaskUpdate, TaskResponse
+from app.models.task import Task
+from app.models.schemas import TaskCreate, TaskListItem, TaskUpdate, TaskResponse
 from app.services.task_service import TaskService
 
 router = APIRouter()
 
-@router.get("/", response_model=List[TaskResponse])
-def get_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all tasks"""
-    tasks = TaskService.get_tasks(db, skip=skip, limit=limit)
-    return tasks
+def _tasks_etag(db: Session) -> str:
+    """Weak ETag for the task list: changes whenever any row does"""
+    last_updated, count = db.query(func.max(Task.updated_at), func.count(Task.id)).one()
+    # Epoch seconds keep the tag free of spaces, which RFC 7232 forbids
+    last_modified = last_updated.timestamp() if last_updated is not None else 0
+    return f'W/"{count}-{last_modified}"'
+
+@router.get("/", response_model=List[TaskListItem])
+def get_tasks(
+    request: Request,
+    response: Response,
+    after: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+):
+    """Get tasks; pass the last item's order_position as `after` for the next page"""
+    # One scalar query decides whether polling clients need the list at all
+    etag = _tasks_etag(db)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return TaskService.get_tasks(db, after=after, limit=limit)
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(task: TaskCreate, db: Session = Depends(get_db)):
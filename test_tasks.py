@@ -1,6 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -21,6 +21,16 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# In-memory test database: skip journaling and sync work SQLite does for
+# durability that a throwaway :memory: store never needs
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 # Define test models directly to avoid importing conflicts
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
 from datetime import datetime
@@ -49,23 +59,31 @@ app.dependency_overrides[get_db] = override_get_db
 # Create test client
 client = TestClient(app)
 
-@pytest.fixture(scope="function")
-def test_db():
-    # Create the database tables
+@pytest.fixture(scope="module")
+def test_schema():
+    # Build the schema once per module instead of re-running DDL per test
     TestBase.metadata.create_all(bind=engine)
-    
+
+    yield
+
+    TestBase.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="function")
+def test_db(test_schema):
     # Add test data
     db = TestingSessionLocal()
-    
+
     # Add tasks
     db.add(TestTask(title="Test task 1", description="Description 1", completed=False, order_position=1))
     db.add(TestTask(title="Test task 2", description="Description 2", completed=True, order_position=2))
     db.commit()
-    
+
     yield
-    
-    # Drop the tables after the test
-    TestBase.metadata.drop_all(bind=engine)
+
+    # Clear rows instead of dropping and rebuilding the tables
+    db.query(TestTask).delete()
+    db.commit()
+    db.close()
 
 def test_get_tasks(test_db):
     response = client.get("/api/tasks/")
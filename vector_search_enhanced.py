@@ -11,16 +11,28 @@ This module provides an optimized vector search implementation with:
 """
 
 import os
+import json
 import time
+import pickle
 import asyncio
 import logging
 import numpy as np
+from uuid import uuid4
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Union, Tuple, Set, Callable
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from functools import lru_cache
 from dataclasses import dataclass, field
 
+# xxh3 hashes at memory speed vs. MD5/SHA's cryptographic cost; optional,
+# with the stock cache_key as fallback
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Vector DB and embedding libraries
+import httpx
+import openai
 from langchain_community.embeddings import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 from langchain_core.embeddings import Embeddings
@@ -37,10 +49,83 @@ logger = logging.getLogger("vector_search")
 
 # Constants
 DEFAULT_EMBEDDING_DIMENSION = 1536  # OpenAI ada-002 dimension
+# Known output dimensions per embedding model; stats can skip probing Chroma
+DIM_BY_MODEL = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
 DEFAULT_SIMILARITY_THRESHOLD = 0.75
 DEFAULT_BATCH_SIZE = 100
+MAX_BATCH_CHARS = 32000  # ~8k tokens at ~4 chars/token per embedding batch
 DEFAULT_PARALLEL_REQUESTS = 5
 DEFAULT_CACHE_TTL = 3600  # 1 hour
+WARM_CACHE_SIZE = 512  # hottest embeddings persisted across restarts
+SEMANTIC_CACHE_SIZE = 128  # recent query embeddings kept for fuzzy hits
+SEMANTIC_CACHE_THRESHOLD = 0.97  # min cosine similarity to reuse results
+
+
+@lru_cache(maxsize=1)
+def _openai_async_client(api_key: str) -> "openai.AsyncOpenAI":
+    """
+    Process-wide async OpenAI client.
+
+    One client means one httpx connection pool, so concurrent embedding
+    batches reuse warm TCP+TLS connections instead of re-handshaking when a
+    service is reinstantiated (tests, workers, reloads).
+    """
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        ),
+    )
+
+
+def _search_cache_key(
+    query: str,
+    collection: str,
+    limit: int,
+    filters: Optional[Dict[str, Any]],
+    similarity_threshold: float
+) -> str:
+    """Cache key for a search, canonicalizing filters so dict order can't split
+    logically identical queries across keys."""
+    canon_filters = json.dumps(filters or {}, sort_keys=True, separators=(",", ":"))
+    if xxhash is not None:
+        return "vs:" + xxhash.xxh3_64_hexdigest(
+            f"{collection}|{limit}|{similarity_threshold}|{canon_filters}|{query}"
+        )
+    return cache_key(
+        "vector_search", query, collection, limit, canon_filters, similarity_threshold
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_filter_cached(frozen_items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Build a Chroma filter dict from frozen (key, value) items.
+
+    Memoized: hot query patterns reuse the same few filters, so the dict
+    rewrite runs once per distinct filter. Callers must not mutate the result.
+    """
+    filter_dict = {}
+    for key, value in frozen_items:
+        if isinstance(value, tuple):
+            filter_dict[key] = {"$in": list(value)}
+        else:
+            filter_dict[key] = value
+    return filter_dict
+
+
+def _embedding_cache_key(text: str, model_name: str) -> str:
+    """Cache key for one text's embedding.
+
+    Keyed by model (and a format version) so swapping embedding models can
+    never serve vectors of the wrong dimension out of a warm cache.
+    """
+    if xxhash is not None:
+        return f"embedding:v1:{model_name}:" + xxhash.xxh3_64_hexdigest(text)
+    return cache_key("embedding", "v1", model_name, text)
 
 
 @dataclass
@@ -92,18 +177,16 @@ class MockEmbeddings(Embeddings):
     def __init__(self, dimension: int = DEFAULT_EMBEDDING_DIMENSION):
         """Initialize mock embeddings."""
         self.dimension = dimension
+        # Allocate the constant vector once; all calls share it by reference
+        self._mock_embedding = [0.1] * dimension
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Return mock embeddings for documents."""
-        return [self._get_mock_embedding() for _ in texts]
+        return [self._mock_embedding] * len(texts)
     
     def embed_query(self, text: str) -> List[float]:
         """Return mock embedding for query."""
-        return self._get_mock_embedding()
-    
-    def _get_mock_embedding(self) -> List[float]:
-        """Generate a deterministic mock embedding based on text."""
-        return [0.1] * self.dimension
+        return self._mock_embedding
 
 
 class EmbeddingService:
@@ -117,11 +200,15 @@ class EmbeddingService:
             model_name: Name of the embedding model to use
         """
         self.model_name = model_name or settings.OPENAI_EMBEDDING_MODEL
+        self._async_client = None
         self.embeddings = self._initialize_embeddings()
         self.cache = get_cache("embeddings")
         self.cache_ttl = settings.CACHE_TTL
-        self.executor = ThreadPoolExecutor(max_workers=DEFAULT_PARALLEL_REQUESTS)
-        logger.info(f"Embedding service initialized with model: {self.model_name}")
+        # Bounds concurrent embedding API requests in get_embeddings_async
+        self._semaphore = asyncio.Semaphore(DEFAULT_PARALLEL_REQUESTS)
+        # Recently used embeddings, LRU-ordered, for warm-start persistence
+        self._warm_entries = OrderedDict()
+        logger.info("Embedding service initialized with model: %s", self.model_name)
     
     def _initialize_embeddings(self) -> Embeddings:
         """
@@ -134,13 +221,17 @@ class EmbeddingService:
         openai_api_key = get_api_key("openai")
         if openai_api_key:
             try:
+                # Async client for batch paths: sub-batches go out concurrently
+                # instead of serializing inside embed_documents
+                self._async_client = _openai_async_client(openai_api_key)
                 return OpenAIEmbeddings(
                     openai_api_key=openai_api_key,
                     model=self.model_name,
                     chunk_size=DEFAULT_BATCH_SIZE,
                 )
             except Exception as e:
-                logger.warning(f"Failed to initialize OpenAI embeddings: {e}")
+                logger.warning("Failed to initialize OpenAI embeddings: %s", e)
+                self._async_client = None
         
         # TODO: Add support for other embedding models (Anthropic, local models)
         
@@ -148,7 +239,10 @@ class EmbeddingService:
         logger.warning("Using mock embeddings (no API key available)")
         return MockEmbeddings()
     
-    @cached(namespace="embeddings")
+    @cached(
+        namespace="embeddings",
+        key_func=lambda self, text: _embedding_cache_key(text, self.model_name),
+    )
     def get_embedding(self, text: str) -> List[float]:
         """
         Get embedding for a single text with caching.
@@ -159,11 +253,87 @@ class EmbeddingService:
         Returns:
             List[float]: Embedding vector
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         embedding = self.embeddings.embed_query(text)
-        logger.debug(f"Embedding generated in {(time.time() - start_time) * 1000:.2f}ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Embedding generated in %.2fms", (time.perf_counter() - start_time) * 1000)
+        # Body only runs on a cache miss, which is exactly the set of
+        # embeddings worth persisting for the next cold start
+        self._note_warm(_embedding_cache_key(text, self.model_name), embedding)
         return embedding
     
+    def _note_warm(self, key: str, embedding: List[float]) -> None:
+        """Track a recently used embedding for the warm-start file."""
+        self._warm_entries[key] = embedding
+        self._warm_entries.move_to_end(key)
+        while len(self._warm_entries) > WARM_CACHE_SIZE:
+            self._warm_entries.popitem(last=False)
+    
+    def _warm_cache_path(self) -> str:
+        return os.path.join(settings.VECTOR_DB_PERSIST_DIRECTORY, "embed_warm.pkl")
+    
+    def save_warm_cache(self) -> None:
+        """Persist the hottest embeddings so the next process starts warm."""
+        if not self._warm_entries:
+            return
+        
+        path = self._warm_cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = {"model": self.model_name, "entries": dict(self._warm_entries)}
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        logger.info("Saved %s warm embeddings", len(self._warm_entries))
+    
+    def load_warm_cache(self) -> None:
+        """Seed the embedding cache from the warm-start file, if present."""
+        path = self._warm_cache_path()
+        if not os.path.exists(path):
+            return
+        
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning("Could not load warm embedding cache: %s", e)
+            return
+        
+        # Stale across model upgrades: wrong-dimension vectors must not warm
+        if payload.get("model") != self.model_name:
+            return
+        
+        entries = payload.get("entries", {})
+        for key, embedding in entries.items():
+            self.cache.set(key, embedding, self.cache_ttl)
+        self._warm_entries.update(entries)
+        logger.info("Warmed embedding cache with %s entries", len(entries))
+    
+    async def _embed_batch_async(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed one batch through the async client with bounded concurrency.
+        
+        Retries rate-limit errors with the server's Retry-After when given,
+        exponential backoff otherwise.
+        """
+        async with self._semaphore:
+            delay = 1.0
+            for attempt in range(3):
+                try:
+                    response = await self._async_client.embeddings.create(
+                        model=self.model_name,
+                        input=batch,
+                    )
+                    return [item.embedding for item in response.data]
+                except openai.RateLimitError as e:
+                    if attempt == 2:
+                        raise
+                    retry_after = None
+                    if e.response is not None:
+                        retry_after = e.response.headers.get("retry-after")
+                    await asyncio.sleep(float(retry_after) if retry_after else delay)
+                    delay *= 2
+    
     async def get_embeddings_async(self, texts: List[str]) -> List[List[float]]:
         """
         Get embeddings for multiple texts asynchronously.
@@ -178,7 +348,7 @@ class EmbeddingService:
             return []
         
         # Check cache first
-        cache_keys = [cache_key("embedding", text) for text in texts]
+        cache_keys = [_embedding_cache_key(text, self.model_name) for text in texts]
         cached_embeddings = self.cache.get_many(cache_keys)
         
         # Identify texts that need embedding
@@ -195,30 +365,51 @@ class EmbeddingService:
             # Generate embeddings for missing texts
             missing_texts = [texts[i] for i in missing_indices]
             
-            # Process in batches for efficiency
-            batches = [missing_texts[i:i + DEFAULT_BATCH_SIZE] 
-                      for i in range(0, len(missing_texts), DEFAULT_BATCH_SIZE)]
+            # Pack batches longest-first, capped by count and total chars, so
+            # one long text doesn't stall a batch of short ones and every
+            # batch carries a comparable token load
+            order = sorted(range(len(missing_texts)), key=lambda i: -len(missing_texts[i]))
+            batches = []
+            current, current_chars = [], 0
+            for i in order:
+                text = missing_texts[i]
+                if current and (len(current) >= DEFAULT_BATCH_SIZE
+                                or current_chars + len(text) > MAX_BATCH_CHARS):
+                    batches.append(current)
+                    current, current_chars = [], 0
+                current.append(text)
+                current_chars += len(text)
+            if current:
+                batches.append(current)
             
             # Generate embeddings in parallel
-            loop = asyncio.get_event_loop()
-            batch_results = await asyncio.gather(*[
-                loop.run_in_executor(
-                    self.executor,
-                    partial(self.embeddings.embed_documents, batch)
+            if self._async_client is not None:
+                batch_results = await asyncio.gather(
+                    *(self._embed_batch_async(batch) for batch in batches)
                 )
-                for batch in batches
-            ])
+            else:
+                # No async client (mock or non-OpenAI backend): fall back to
+                # the sync embedder in worker threads
+                batch_results = await asyncio.gather(*[
+                    asyncio.to_thread(self.embeddings.embed_documents, batch)
+                    for batch in batches
+                ])
             
             # Flatten batch results
             all_embeddings = []
             for batch in batch_results:
                 all_embeddings.extend(batch)
             
-            # Update results and cache
-            for idx, embedding in zip(missing_indices, all_embeddings):
+            # Scatter back through the sort permutation to restore input order
+            for i, embedding in zip(order, all_embeddings):
+                idx = missing_indices[i]
                 results[idx] = embedding
                 self.cache.set(cache_keys[idx], embedding, self.cache_ttl)
         
+        # Track usage for the warm-start file (hits and misses alike)
+        for key, embedding in zip(cache_keys, results):
+            self._note_warm(key, embedding)
+        
         return results
 
 
@@ -240,6 +431,13 @@ class VectorSearchEnhanced:
         self.initialized = False
         self.cache = get_cache("vector_search")
         self.cache_ttl = settings.CACHE_TTL
+        # Semantic cache: near-duplicate queries ("What is RAG?" vs
+        # "what is rag") miss the exact-string cache but land here once
+        # their embeddings are close enough
+        self._recent_query_embeddings = None  # (K, dim) float32, unit norm
+        self._recent_query_results = []  # parallel [(params_key, results)]
+        # Collections written since their last persist()
+        self._dirty: Set[str] = set()
         logger.info("Enhanced vector search service initialized")
     
     async def initialize(self):
@@ -258,6 +456,10 @@ class VectorSearchEnhanced:
             persist_directory=os.path.join(settings.VECTOR_DB_PERSIST_DIRECTORY, "tal_blocks")
         )
         
+        # Seed the embedding cache from the last run's hottest entries so
+        # cold starts don't pay a miss storm
+        await asyncio.to_thread(self.embedding_service.load_warm_cache)
+        
         self.initialized = True
         logger.info("Vector stores initialized")
     
@@ -286,6 +488,72 @@ class VectorSearchEnhanced:
             persist_directory=persist_directory
         )
     
+    @staticmethod
+    def _build_filter_dict(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Convert simple filters to Chroma's operator syntax."""
+        if not filters:
+            return None
+        
+        try:
+            frozen = tuple(sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in filters.items()
+            ))
+            return _build_filter_cached(frozen)
+        except TypeError:
+            # Unhashable filter values can't be memoized; build directly
+            filter_dict = {}
+            for key, value in filters.items():
+                if isinstance(value, list):
+                    filter_dict[key] = {"$in": value}
+                else:
+                    filter_dict[key] = value
+            return filter_dict
+    
+    def _semantic_cache_get(
+        self,
+        query_embedding: List[float],
+        params_key: Tuple
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a near-duplicate query, if any."""
+        if not self._recent_query_results:
+            return None
+        
+        q = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return None
+        
+        sims = self._recent_query_embeddings @ (q / norm)
+        for i in np.argsort(sims)[::-1]:
+            if sims[i] < SEMANTIC_CACHE_THRESHOLD:
+                break
+            if self._recent_query_results[i][0] == params_key:
+                return self._recent_query_results[i][1]
+        return None
+    
+    def _semantic_cache_put(
+        self,
+        query_embedding: List[float],
+        params_key: Tuple,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """Remember a query embedding and its results, evicting ring-buffer style."""
+        q = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return
+        
+        q = q / norm
+        if self._recent_query_embeddings is None:
+            self._recent_query_embeddings = q[np.newaxis, :]
+        else:
+            self._recent_query_embeddings = np.vstack(
+                [self._recent_query_embeddings, q]
+            )[-SEMANTIC_CACHE_SIZE:]
+        self._recent_query_results.append((params_key, results))
+        del self._recent_query_results[:-SEMANTIC_CACHE_SIZE]
+    
     async def search(
         self, 
         query: str, 
@@ -313,7 +581,7 @@ class VectorSearchEnhanced:
                 Search results and optionally metrics
         """
         metrics = SearchMetrics()
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Check if initialized
         if not self.initialized:
@@ -324,43 +592,47 @@ class VectorSearchEnhanced:
             raise ValueError(f"Collection {collection} not found")
         
         # Generate cache key
-        cache_key_str = cache_key(
-            "vector_search", 
-            query, 
-            collection, 
-            limit, 
-            str(filters), 
-            similarity_threshold
+        cache_key_str = _search_cache_key(
+            query, collection, limit, filters, similarity_threshold
         )
         
         # Check cache
         cached_results = self.cache.get(cache_key_str)
         if cached_results is not None:
             metrics.cache_hit = True
-            metrics.total_time_ms = (time.time() - start_time) * 1000
+            metrics.total_time_ms = (time.perf_counter() - start_time) * 1000
             
             if return_metrics:
                 return cached_results, metrics.to_dict()
             return cached_results
         
         # Generate embedding
-        embedding_start = time.time()
+        embedding_start = time.perf_counter()
         query_embedding = self.embedding_service.get_embedding(query)
-        metrics.embedding_time_ms = (time.time() - embedding_start) * 1000
+        metrics.embedding_time_ms = (time.perf_counter() - embedding_start) * 1000
+        
+        # Check the semantic cache for a near-duplicate query
+        params_key = (
+            collection,
+            limit,
+            json.dumps(filters or {}, sort_keys=True, separators=(",", ":")),
+            similarity_threshold,
+        )
+        semantic_hit = self._semantic_cache_get(query_embedding, params_key)
+        if semantic_hit is not None:
+            metrics.cache_hit = True
+            metrics.total_time_ms = (time.perf_counter() - start_time) * 1000
+            
+            if return_metrics:
+                return semantic_hit, metrics.to_dict()
+            return semantic_hit
         
         # Search vector store
-        db_search_start = time.time()
+        db_search_start = time.perf_counter()
         vector_store = self.vector_stores[collection]
         
         # Apply filters if provided
-        filter_dict = None
-        if filters:
-            filter_dict = {}
-            for key, value in filters.items():
-                if isinstance(value, list):
-                    filter_dict[key] = {"$in": value}
-                else:
-                    filter_dict[key] = value
+        filter_dict = self._build_filter_dict(filters)
         
         # Increase k to allow for filtering by threshold
         search_limit = max(limit * 3, 20)
@@ -372,45 +644,49 @@ class VectorSearchEnhanced:
             filter=filter_dict
         )
         
-        metrics.db_search_time_ms = (time.time() - db_search_start) * 1000
+        metrics.db_search_time_ms = (time.perf_counter() - db_search_start) * 1000
         
-        # Process results
-        post_processing_start = time.time()
-        results = []
+        # Process results: score threshold and ordering run vectorized over
+        # one float array instead of allocating a SearchResult per hit
+        # (Chroma returns distance; similarity = 1 - distance)
+        post_processing_start = time.perf_counter()
         
-        for doc, score in raw_results:
-            # Convert distance to similarity (Chroma returns distance)
-            similarity = 1.0 - score
+        if raw_results:
+            scores = 1.0 - np.fromiter(
+                (score for _, score in raw_results),
+                dtype=np.float32,
+                count=len(raw_results),
+            )
+            keep = np.where(scores >= similarity_threshold)[0]
+            metrics.filtered_count = len(raw_results) - int(keep.size)
+            
+            # Rerank results if requested
+            if rerank and keep.size:
+                # TODO: Implement more sophisticated reranking
+                # For now, just ensure they're sorted by score
+                keep = keep[np.argsort(-scores[keep], kind="stable")]
             
-            # Filter by similarity threshold
-            if similarity >= similarity_threshold:
-                results.append(SearchResult(
-                    content=doc.page_content,
-                    metadata=doc.metadata,
-                    score=similarity
-                ))
-        
-        metrics.filtered_count = len(raw_results) - len(results)
-        
-        # Rerank results if requested
-        if rerank and results:
-            # TODO: Implement more sophisticated reranking
-            # For now, just ensure they're sorted by score
-            results.sort(key=lambda x: x.score, reverse=True)
-        
-        # Limit results
-        results = results[:limit]
-        metrics.result_count = len(results)
-        
-        # Convert to dictionaries
-        result_dicts = [result.to_dict() for result in results]
-        metrics.post_processing_time_ms = (time.time() - post_processing_start) * 1000
+            # Limit results and convert to dictionaries
+            result_dicts = [
+                {
+                    "content": raw_results[i][0].page_content,
+                    "metadata": raw_results[i][0].metadata,
+                    "score": float(scores[i]),
+                }
+                for i in keep[:limit]
+            ]
+        else:
+            result_dicts = []
+        
+        metrics.result_count = len(result_dicts)
+        metrics.post_processing_time_ms = (time.perf_counter() - post_processing_start) * 1000
         
         # Cache results
         self.cache.set(cache_key_str, result_dicts, self.cache_ttl)
+        self._semantic_cache_put(query_embedding, params_key, result_dicts)
         
         # Calculate total time
-        metrics.total_time_ms = (time.time() - start_time) * 1000
+        metrics.total_time_ms = (time.perf_counter() - start_time) * 1000
         
         if return_metrics:
             return result_dicts, metrics.to_dict()
@@ -440,19 +716,41 @@ class VectorSearchEnhanced:
         if not queries:
             return []
         
-        # Search in parallel
-        results = await asyncio.gather(*[
-            self.search(
-                query=query,
-                collection=collection,
-                limit=limit,
-                filters=filters,
-                similarity_threshold=similarity_threshold
-            )
-            for query in queries
-        ])
+        if not self.initialized:
+            await self.initialize()
         
-        return results
+        if collection not in self.vector_stores:
+            raise ValueError(f"Collection {collection} not found")
+        
+        # Embed every query in one cache-aware call, then issue a single
+        # batched Chroma query instead of N independent searches
+        embeddings = await self.embedding_service.get_embeddings_async(queries)
+        filter_dict = self._build_filter_dict(filters)
+        search_limit = max(limit * 3, 20)
+        
+        raw = self.vector_stores[collection]._collection.query(
+            query_embeddings=embeddings,
+            n_results=search_limit,
+            where=filter_dict,
+        )
+        
+        # Post-process each row through the same threshold pipeline as search()
+        all_results = []
+        for docs, metadatas, distances in zip(
+            raw["documents"], raw["metadatas"], raw["distances"]
+        ):
+            row = [
+                SearchResult(
+                    content=content,
+                    metadata=metadata or {},
+                    score=1.0 - distance
+                )
+                for content, metadata, distance in zip(docs, metadatas, distances)
+                if 1.0 - distance >= similarity_threshold
+            ]
+            all_results.append([result.to_dict() for result in row[:limit]])
+        
+        return all_results
     
     async def add_documents(
         self,
@@ -478,23 +776,37 @@ class VectorSearchEnhanced:
                 persist_directory=os.path.join(settings.VECTOR_DB_PERSIST_DIRECTORY, collection)
             )
         
-        # Process in batches
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i:i + batch_size]
-            
-            # Extract texts and metadata
+        # Ingest batches concurrently: each batch's embedding calls and
+        # Chroma write are independent, so overlap them under the usual
+        # parallelism bound instead of blocking batch by batch
+        store = self.vector_stores[collection]
+        semaphore = asyncio.Semaphore(DEFAULT_PARALLEL_REQUESTS)
+        
+        async def ingest_one(batch):
             texts = [doc["content"] for doc in batch]
             metadatas = [doc["metadata"] for doc in batch]
-            
-            # Add to vector store
-            self.vector_stores[collection].add_texts(
-                texts=texts,
-                metadatas=metadatas
-            )
-            
-            logger.info(f"Added batch of {len(batch)} documents to {collection}")
+            async with semaphore:
+                # Embed through the cache-aware batch path - re-indexed or
+                # duplicate content hits the embedding cache - then hand the
+                # vectors straight to Chroma instead of letting add_texts
+                # re-embed everything
+                embeddings = await self.embedding_service.get_embeddings_async(texts)
+                await asyncio.to_thread(
+                    store._collection.add,
+                    ids=[str(uuid4()) for _ in texts],
+                    embeddings=embeddings,
+                    documents=texts,
+                    metadatas=metadatas,
+                )
+            logger.info("Added batch of %s documents to %s", len(batch), collection)
+        
+        await asyncio.gather(*(
+            ingest_one(documents[i:i + batch_size])
+            for i in range(0, len(documents), batch_size)
+        ))
         
         # Invalidate cache for this collection
+        self._dirty.add(collection)
         await self.invalidate_cache(collection)
     
     async def delete_documents(
@@ -517,9 +829,10 @@ class VectorSearchEnhanced:
         
         # Delete documents
         self.vector_stores[collection].delete(document_ids)
-        logger.info(f"Deleted {len(document_ids)} documents from {collection}")
+        logger.info("Deleted %s documents from %s", len(document_ids), collection)
         
         # Invalidate cache for this collection
+        self._dirty.add(collection)
         await self.invalidate_cache(collection)
     
     async def invalidate_cache(self, collection: str = None):
@@ -531,7 +844,9 @@ class VectorSearchEnhanced:
         """
         # TODO: Implement more granular cache invalidation
         self.cache.clear()
-        logger.info(f"Cache invalidated for {'all collections' if collection is None else collection}")
+        self._recent_query_embeddings = None
+        self._recent_query_results = []
+        logger.info("Cache invalidated for %s", "all collections" if collection is None else collection)
     
     async def get_collection_stats(self, collection: str) -> Dict[str, Any]:
         """
@@ -556,12 +871,15 @@ class VectorSearchEnhanced:
         # Get count
         count = collection_obj.count()
         
-        # Get sample of embeddings to estimate dimension
-        if count > 0:
-            sample = collection_obj.get(limit=1)
-            embedding_dimension = len(sample["embeddings"][0])
-        else:
-            embedding_dimension = DEFAULT_EMBEDDING_DIMENSION
+        # Dimension is fixed by the model; only probe the store for unknown
+        # models (a disk round trip per stats call otherwise)
+        embedding_dimension = DIM_BY_MODEL.get(self.embedding_service.model_name)
+        if embedding_dimension is None:
+            if count > 0:
+                sample = collection_obj.get(limit=1, include=["embeddings"])
+                embedding_dimension = len(sample["embeddings"][0])
+            else:
+                embedding_dimension = DEFAULT_EMBEDDING_DIMENSION
         
         return {
             "name": collection,
@@ -571,11 +889,14 @@ class VectorSearchEnhanced:
         }
     
     async def close(self):
-        """Close vector stores."""
-        for name, store in self.vector_stores.items():
-            if hasattr(store, "persist"):
+        """Close vector stores, persisting only those written since last persist."""
+        for name in self._dirty:
+            store = self.vector_stores.get(name)
+            if store is not None and hasattr(store, "persist"):
                 store.persist()
-                logger.info(f"Persisted vector store: {name}")
+                logger.info("Persisted vector store: %s", name)
+        self._dirty.clear()
+        await asyncio.to_thread(self.embedding_service.save_warm_cache)
 
 
 # Create a global instance
@@ -1,5 +1,5 @@
 from typing import Dict, Any, List, Optional
-import asyncio
+import time
 from app.services.rag_engine import RAGEngine
 from app.services.agentic_parser import AgenticParser
 
@@ -68,7 +68,7 @@ class WorkflowManager:
                 "retrieved_count": len(retrieved_data.get("knowledge", [])),
                 "tal_blocks_used": len(retrieved_data.get("tal_blocks", [])),
                 "enhancement_triggers": parsed_data.get("enhancement_triggers", []),
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.perf_counter()
             }
         }
         